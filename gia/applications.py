@@ -3,14 +3,103 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterator
+
+try:
+    from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+except ImportError:  # optional: uploads fall back to requests' in-memory encoding
+    MultipartEncoder = MultipartEncoderMonitor = None
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from .client import IGAClient
 
 log = logging.getLogger(__name__)
 
 BASE_PATH = "/governance/application"
+NAME_CACHE_TTL_SECONDS = 60.0
+
+
+class _RewindableMultipart:
+    """Streaming multipart upload body that can be rewound for retries.
+
+    A ``MultipartEncoder`` is read-once, so when urllib3 retries a POST
+    (e.g. after a 503) it would resend the headers with an empty body.
+    urllib3 rewinds bodies that expose ``tell``/``seek``; seeking back to
+    the start here rebuilds the encoder, with the same boundary, from the
+    beginning of the file.
+    """
+
+    def __init__(
+        self,
+        f: IO[bytes],
+        filename: str,
+        object_type: str,
+        progress: Callable[[int, int], None] | None = None,
+    ):
+        self._file = f
+        self._start = f.tell()
+        self._filename = filename
+        self._object_type = object_type
+        self._progress = progress
+        self._encoder = self._build()
+        self.content_type: str = self._encoder.content_type
+        self.len: int = self._encoder.len
+        self._pos = 0
+
+    def _build(self, boundary: str | None = None):
+        self._file.seek(self._start)
+        encoder = MultipartEncoder(
+            fields={
+                "objectType": self._object_type,
+                "file": (self._filename, self._file, "text/csv"),
+            },
+            boundary=boundary,
+        )
+        if self._progress is not None:
+            progress = self._progress
+            encoder = MultipartEncoderMonitor(
+                encoder, lambda monitor: progress(monitor.bytes_read, monitor.len)
+            )
+        return encoder
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._encoder.read(size)
+        self._pos += len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if offset != 0 or whence != os.SEEK_SET:
+            raise OSError("multipart upload body can only be rewound to the start")
+        encoder = self._encoder
+        boundary = getattr(encoder, "encoder", encoder).boundary_value
+        self._encoder = self._build(boundary)
+        self._pos = 0
+        return 0
+
+
+def _to_dataframe(records: Iterator[dict]) -> pd.DataFrame:
+    """Collect ``records`` into a DataFrame, flattening nested objects into dotted columns."""
+    try:
+        import pandas as pd
+    except ImportError as exc:
+        raise ImportError("DataFrame helpers require pandas: pip install 'gia[dataframe]'") from exc
+    return pd.json_normalize(list(records))
+
+
+@lru_cache(maxsize=256)
+def _name_filter(name: str) -> str:
+    """Build an exact-match ``_queryFilter`` for ``name``, escaping ``\\`` and ``"``."""
+    escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+    return f'name eq "{escaped}"'
 
 
 class ApplicationsAPI:
@@ -21,6 +110,8 @@ class ApplicationsAPI:
 
     def __init__(self, client: IGAClient):
         self._client = client
+        # name -> (monotonic timestamp, application or None)
+        self._app_by_name: dict[str, tuple[float, dict | None]] = {}
 
     # ------------------------------------------------------------------
     # Application CRUD
@@ -72,21 +163,55 @@ class ApplicationsAPI:
             params["endUserId"] = end_user_id
         return self._client.api_get(f"{BASE_PATH}/{application_id}", params=params or None)
 
+    def batch_get(
+        self,
+        application_ids: list[str],
+        fields: str | None = None,
+        max_workers: int = 16,
+    ) -> list[dict]:
+        """Get several applications by ID, preserving the input order.
+
+        The API has no batch-describe endpoint, so the individual lookups
+        are issued concurrently.
+
+        Raises:
+            IGANotFoundError: If any of the applications does not exist.
+        """
+        if not application_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(application_ids))) as executor:
+            return list(executor.map(
+                lambda application_id: self.get_application(application_id, fields=fields),
+                application_ids,
+            ))
+
     def create_application(self, payload: dict) -> dict:
         """Create a disconnected application.
 
         Args:
             payload: Application body matching ``ApplicationDisconnected`` schema.
         """
-        return self._client.api_post(BASE_PATH, json=payload, params={"action": "create"})
+        # Invalidate once the write is done, so a lookup racing the request
+        # cannot re-cache the pre-write state; a failed request may still
+        # have applied, so invalidate then too
+        try:
+            return self._client.api_post(BASE_PATH, json=payload, params={"action": "create"})
+        finally:
+            self._invalidate_name_cache(name=payload.get("name"))
 
     def update_application(self, application_id: str, payload: dict) -> dict:
         """Update an application by ID (full replace)."""
-        return self._client.api_put(f"{BASE_PATH}/{application_id}", json=payload)
+        try:
+            return self._client.api_put(f"{BASE_PATH}/{application_id}", json=payload)
+        finally:
+            self._invalidate_name_cache(name=payload.get("name"), application_id=application_id)
 
     def delete_application(self, application_id: str) -> dict:
         """Delete an application by ID."""
-        return self._client.api_delete(f"{BASE_PATH}/{application_id}")
+        try:
+            return self._client.api_delete(f"{BASE_PATH}/{application_id}")
+        finally:
+            self._invalidate_name_cache(application_id=application_id)
 
     # ------------------------------------------------------------------
     # Object Types
@@ -121,25 +246,61 @@ class ApplicationsAPI:
     # File Upload
     # ------------------------------------------------------------------
 
-    def upload_file(self, application_id: str, file_path: str, object_type: str) -> dict:
+    def upload_file(
+        self,
+        application_id: str,
+        file_path: str,
+        object_type: str,
+        progress: Callable[[int, int], None] | None = None,
+        use_multipart: bool = True,
+    ) -> dict:
         """Upload a CSV file for a disconnected application.
 
+        When ``requests-toolbelt`` is installed the file is streamed in chunks;
+        otherwise ``requests`` encodes the whole multipart body in memory.
+        With ``use_multipart=False`` the file is streamed as a raw
+        ``text/csv`` body and ``objectType`` moves to the query string, for
+        tenants that accept that form.
+
         Args:
             application_id: Target application ID.
             file_path: Path to the CSV file on disk.
             object_type: The object type this file contains (e.g. ``__ACCOUNT__``).
+            progress: Optional ``progress(bytes_sent, total_bytes)`` callback,
+                      invoked as the streamed body is read. Ignored when
+                      ``requests-toolbelt`` is not installed or
+                      ``use_multipart`` is ``False``.
+            use_multipart: Send a ``multipart/form-data`` body (default).
 
         Returns:
             Upload response with extraction IDs.
         """
+        path = f"{BASE_PATH}/{application_id}"
+        params = {"_action": "upload"}
         with open(file_path, "rb") as f:
-            files = {"file": f}
-            data = {"objectType": object_type}
+            if not use_multipart:
+                return self._client.api_post(
+                    path,
+                    params={**params, "objectType": object_type},
+                    data=f,
+                    headers={"Content-Type": "text/csv"},
+                )
+
+            if MultipartEncoder is None:
+                return self._client.api_post(
+                    path,
+                    params=params,
+                    files={"file": f},
+                    data={"objectType": object_type},
+                )
+
+            # Stream the multipart body from disk instead of buffering the whole file
+            body = _RewindableMultipart(f, os.path.basename(file_path), object_type, progress)
             return self._client.api_post(
-                f"{BASE_PATH}/{application_id}",
-                params={"_action": "upload"},
-                files=files,
-                data=data,
+                path,
+                params=params,
+                data=body,
+                headers={"Content-Type": body.content_type},
             )
 
     def get_files(self, application_id: str) -> list[dict]:
@@ -155,14 +316,39 @@ class ApplicationsAPI:
         """Get failure records for a specific upload operation."""
         return self._client.api_get(f"{BASE_PATH}/{application_id}/upload/:{upload_id}/failures")
 
+    def iter_upload_failures(
+        self,
+        application_id: str,
+        upload_id: str,
+        page_size: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield failure records for an upload operation, one page at a time."""
+        return self._client.iter_paginated(
+            f"{BASE_PATH}/{application_id}/upload/:{upload_id}/failures",
+            page_size=page_size,
+        )
+
     # ------------------------------------------------------------------
     # Accounts (raw disconnected data)
     # ------------------------------------------------------------------
 
-    def list_accounts(self, application_id: str) -> list[dict]:
-        """List raw account data for an application."""
-        body = self._client.api_get(f"{BASE_PATH}/{application_id}/account")
-        return body.get("result", [])
+    def list_accounts(
+        self,
+        application_id: str,
+        page_size: int | None = None,
+        fields: str | None = None,
+    ) -> list[dict]:
+        """List raw account data for an application (auto-paginated).
+
+        Args:
+            application_id: Application ID.
+            page_size: Override default page size.
+            fields: Comma-separated field names to return.
+        """
+        params = {"_fields": fields} if fields is not None else None
+        return self._client.api_get_paginated(
+            f"{BASE_PATH}/{application_id}/account", params=params, page_size=page_size
+        )
 
     def get_account(self, application_id: str, account_id: str) -> dict:
         """Get a single raw account by ID."""
@@ -172,20 +358,95 @@ class ApplicationsAPI:
     # Resources (raw disconnected data)
     # ------------------------------------------------------------------
 
-    def list_resources(self, application_id: str) -> list[dict]:
-        """List raw resource data for an application."""
-        body = self._client.api_get(f"{BASE_PATH}/{application_id}/resource")
-        return body.get("result", [])
+    def list_resources(
+        self,
+        application_id: str,
+        page_size: int | None = None,
+        fields: str | None = None,
+    ) -> list[dict]:
+        """List raw resource data for an application (auto-paginated).
+
+        Args:
+            application_id: Application ID.
+            page_size: Override default page size.
+            fields: Comma-separated field names to return.
+        """
+        params = {"_fields": fields} if fields is not None else None
+        return self._client.api_get_paginated(
+            f"{BASE_PATH}/{application_id}/resource", params=params, page_size=page_size
+        )
 
     def get_resource(self, application_id: str, resource_id: str) -> dict:
         """Get a single raw resource by ID."""
         return self._client.api_get(f"{BASE_PATH}/{application_id}/resource/{resource_id}")
 
+    # ------------------------------------------------------------------
+    # DataFrame helpers (optional pandas dependency)
+    # ------------------------------------------------------------------
+
+    def list_applications_df(self, query_filter: str | None = None, fields: str | None = None) -> pd.DataFrame:
+        """Like :meth:`list_applications`, but return a flattened ``pandas.DataFrame``."""
+        params: dict[str, Any] = {}
+        if query_filter is not None:
+            params["_queryFilter"] = query_filter
+        if fields is not None:
+            params["_fields"] = fields
+        return _to_dataframe(self._client.iter_paginated(BASE_PATH, params=params))
+
+    def list_accounts_df(
+        self,
+        application_id: str,
+        page_size: int | None = None,
+        fields: str | None = None,
+    ) -> pd.DataFrame:
+        """Like :meth:`list_accounts`, but return a flattened ``pandas.DataFrame``."""
+        params = {"_fields": fields} if fields is not None else None
+        return _to_dataframe(self._client.iter_paginated(
+            f"{BASE_PATH}/{application_id}/account", params=params, page_size=page_size
+        ))
+
+    def list_resources_df(
+        self,
+        application_id: str,
+        page_size: int | None = None,
+        fields: str | None = None,
+    ) -> pd.DataFrame:
+        """Like :meth:`list_resources`, but return a flattened ``pandas.DataFrame``."""
+        params = {"_fields": fields} if fields is not None else None
+        return _to_dataframe(self._client.iter_paginated(
+            f"{BASE_PATH}/{application_id}/resource", params=params, page_size=page_size
+        ))
+
     # ------------------------------------------------------------------
     # Lookup helpers
     # ------------------------------------------------------------------
 
     def find_application_by_name(self, name: str) -> dict | None:
-        """Find an application by exact name match. Returns None if not found."""
-        results = self.list_applications(query_filter=f'name eq "{name}"')
-        return results[0] if results else None
\ No newline at end of file
+        """Find an application by exact name match. Returns None if not found.
+
+        Only the ``id`` and ``name`` of a single record are requested. Results
+        (including misses) are cached per name for
+        ``NAME_CACHE_TTL_SECONDS``; creating, updating or deleting an
+        application through this API invalidates the affected entries.
+        Callers get a copy, so mutating it does not alter the cache.
+        """
+        cached = self._app_by_name.get(name)
+        if cached is not None and time.monotonic() - cached[0] < NAME_CACHE_TTL_SECONDS:
+            app = cached[1]
+            return dict(app) if app is not None else None
+
+        # Stop after the first match instead of draining every page
+        app = next(self._client.iter_paginated(
+            BASE_PATH, params={"_queryFilter": _name_filter(name), "_fields": "id,name"}, page_size=1
+        ), None)
+        self._app_by_name[name] = (time.monotonic(), app)
+        return dict(app) if app is not None else None
+
+    def _invalidate_name_cache(self, name: str | None = None, application_id: str | None = None) -> None:
+        """Drop cached name lookups for ``name`` and for any entry resolving to ``application_id``."""
+        if name is not None:
+            self._app_by_name.pop(name, None)
+        if application_id is not None:
+            for cached_name, (_, app) in list(self._app_by_name.items()):
+                if app and app.get("id") == application_id:
+                    self._app_by_name.pop(cached_name, None)
\ No newline at end of file
@@ -2,6 +2,8 @@
 
 import time
 import logging
+import random
+import threading
 import requests
 
 from .exceptions import IGAAuthError
@@ -13,31 +15,101 @@ class OAuth2ClientCredentials:
     """Fetches and caches an OAuth2 access token using the client_credentials grant.
 
     Automatically refreshes the token when it expires (with a small buffer).
+    With ``background_refresh=True`` a daemon thread also renews the token
+    shortly before it expires, so requests rarely wait on the token endpoint.
     """
 
     TOKEN_EXPIRY_BUFFER_SECONDS = 30
+    REFRESH_LEAD_SECONDS = 60
+    REFRESH_JITTER_SECONDS = 15
+    REFRESH_RETRY_SECONDS = 10
 
-    def __init__(self, client_id: str, client_secret: str, token_endpoint: str, scopes: str | None = None):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token_endpoint: str,
+        scopes: str | None = None,
+        background_refresh: bool = False,
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.token_endpoint = token_endpoint
         self.scopes = scopes
 
         self._access_token: str | None = None
+        self._authorization_header: str | None = None
         self._expires_at: float = 0.0
+        self._expires_in: float = 0.0
+        self._lock = threading.Lock()
+
+        self._stop_refresh = threading.Event()
+        self._refresh_thread: threading.Thread | None = None
+        if background_refresh:
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="gia-token-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def close(self) -> None:
+        """Stop the background refresh thread, if one is running."""
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
 
     @property
     def access_token(self) -> str:
         """Return a valid access token, fetching or refreshing as needed."""
         if self._is_expired():
-            self._fetch_token()
+            self._refresh_if_expired()
         return self._access_token  # type: ignore[return-value]
 
+    @property
+    def authorization_header(self) -> str:
+        """Return the ``Authorization`` header value (``Bearer <token>``).
+
+        The formatted string is cached alongside the token and rebuilt only
+        when the token is refreshed.
+        """
+        if self._is_expired():
+            self._refresh_if_expired()
+        return self._authorization_header  # type: ignore[return-value]
+
     def _is_expired(self) -> bool:
         if self._access_token is None:
             return True
         return time.time() >= (self._expires_at - self.TOKEN_EXPIRY_BUFFER_SECONDS)
 
+    def _refresh_if_expired(self) -> None:
+        # Re-check under the lock so concurrent callers fetch only once
+        with self._lock:
+            if self._is_expired():
+                self._fetch_token()
+
+    def _next_refresh_delay(self) -> float:
+        """Seconds until the background thread should renew the token."""
+        if self._access_token is None:
+            return 0.0
+        # Refresh ahead of expiry; jitter spreads out many clients. Tokens
+        # shorter-lived than the lead are renewed at half their lifetime,
+        # and never more often than REFRESH_RETRY_SECONDS.
+        lead = self.REFRESH_LEAD_SECONDS + random.uniform(0, self.REFRESH_JITTER_SECONDS)
+        lead = min(lead, self._expires_in / 2)
+        delay = self._expires_at - lead - time.time()
+        return max(delay, self.REFRESH_RETRY_SECONDS)
+
+    def _refresh_loop(self) -> None:
+        while not self._stop_refresh.wait(self._next_refresh_delay()):
+            try:
+                with self._lock:
+                    self._fetch_token()
+            except Exception as exc:
+                # Keep the thread alive; requests still refresh inline if needed
+                log.warning("Background token refresh failed: %s", exc)
+                if self._stop_refresh.wait(self.REFRESH_RETRY_SECONDS):
+                    return
+
     def _fetch_token(self) -> None:
         data: dict[str, str] = {
             "grant_type": "client_credentials",
@@ -54,8 +126,15 @@ class OAuth2ClientCredentials:
         except requests.RequestException as exc:
             raise IGAAuthError(f"Token request failed: {exc}") from exc
 
-        body = resp.json()
-        self._access_token = body["access_token"]
-        expires_in = body.get("expires_in", 3600)
+        try:
+            body = resp.json()
+            token = body["access_token"]
+            expires_in = float(body.get("expires_in", 3600))
+        except (ValueError, TypeError, KeyError) as exc:
+            raise IGAAuthError(f"Malformed token response: {exc!r}") from exc
+
+        self._access_token = token
+        self._authorization_header = f"Bearer {token}"
+        self._expires_in = expires_in
         self._expires_at = time.time() + expires_in
         log.debug("Access token acquired, expires in %ds", expires_in)
\ No newline at end of file
@@ -1,21 +1,92 @@
 """Base HTTP client for PingOne IGA API."""
 
 import logging
+import os
+import socket
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from typing import Iterator
 from urllib.parse import urljoin
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib codec
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+    _json_loads = json.loads
+else:
+    # Coerce non-str dict keys (e.g. integer YAML keys) as the stdlib does
+    _json_dumps = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    _json_loads = orjson.loads
+
 from .auth import OAuth2ClientCredentials
 from .exceptions import IGAClientError, IGANotFoundError
 
 log = logging.getLogger(__name__)
 
-DEFAULT_PAGE_SIZE = 50
+DEFAULT_PAGE_SIZE = 200
+MIN_PAGE_SIZE = 50
+PAGE_SIZE_ENV_VAR = "GIA_PAGE_SIZE"
+DEFAULT_MAX_WORKERS = 8
 MAX_RETRIES = 3
 RETRY_BACKOFF = 0.5
 RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+POOL_MAXSIZE = 32
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+# Retry is immutable (urllib3 copies it on each increment), so one instance
+# serves every adapter
+_RETRY = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=RETRY_BACKOFF,
+    status_forcelist=RETRY_STATUS_CODES,
+    allowed_methods=["GET", "POST", "PUT", "DELETE"],
+)
+
+
+def _page_size_from_env() -> int:
+    """Read ``GIA_PAGE_SIZE``, falling back to the default if it is unusable."""
+    raw = os.environ.get(PAGE_SIZE_ENV_VAR)
+    if raw is None:
+        return DEFAULT_PAGE_SIZE
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        log.warning("Ignoring invalid %s=%r; using %d", PAGE_SIZE_ENV_VAR, raw, DEFAULT_PAGE_SIZE)
+        return DEFAULT_PAGE_SIZE
+    return value
+
+
+def _is_page_size_error(exc: IGAClientError) -> bool:
+    """Whether a 400 response is complaining about ``_pageSize``."""
+    text = f"{exc.message} {exc.details}".lower().replace("_", "").replace(" ", "")
+    return "pagesize" in text
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive on pooled sockets.
+
+    Keeps long-lived sessions (e.g. a push with large uploads) from having
+    idle connections silently dropped between requests.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        )
+        super().init_poolmanager(*args, **kwargs)
 
 
 class IGAClient:
@@ -29,7 +100,14 @@ class IGAClient:
         client_secret: OAuth2 client secret.
         token_endpoint: Full URL for the token endpoint.
         scopes: Optional OAuth2 scopes string.
-        page_size: Default page size for paginated requests.
+        page_size: Default page size for paginated requests. Falls back to the
+            ``GIA_PAGE_SIZE`` environment variable, then ``DEFAULT_PAGE_SIZE``.
+        max_workers: Maximum number of pages fetched concurrently.
+        background_token_refresh: Renew the access token on a background
+            thread shortly before it expires. Call :meth:`close` to stop it.
+        session: Optional preconfigured ``requests.Session``. Clients that
+            share a session also share its connection pool; the JSON
+            ``Content-Type``/``Accept`` headers are added if missing.
     """
 
     def __init__(
@@ -39,24 +117,41 @@ class IGAClient:
         client_secret: str,
         token_endpoint: str,
         scopes: str | None = None,
-        page_size: int = DEFAULT_PAGE_SIZE,
+        page_size: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        background_token_refresh: bool = False,
+        session: requests.Session | None = None,
     ):
         self.base_url = base_url.rstrip("/")
-        self.page_size = page_size
-        self._auth = OAuth2ClientCredentials(client_id, client_secret, token_endpoint, scopes)
-        self._session = self._build_session()
-
-        # Lazily initialized sub-APIs
-        self._applications: "ApplicationsAPI | None" = None
-
-    @property
+        self._url_prefix = f"{self.base_url}/iga"
+        self.page_size = page_size or _page_size_from_env()
+        self.max_workers = max_workers
+        self._auth = OAuth2ClientCredentials(
+            client_id, client_secret, token_endpoint, scopes, background_refresh=background_token_refresh
+        )
+        self._owns_session = session is None
+        if session is None:
+            session = self._build_session(pool_maxsize=max(POOL_MAXSIZE, max_workers))
+        else:
+            for name, value in _JSON_HEADERS.items():
+                session.headers.setdefault(name, value)
+        self._session = session
+
+    @cached_property
     def applications(self) -> "ApplicationsAPI":
-        """Access the ``/governance/application`` endpoints."""
+        """Access the ``/governance/application`` endpoints (created on first use)."""
         # Import here to avoid circular dependency
         from .applications import ApplicationsAPI
-        if self._applications is None:
-            self._applications = ApplicationsAPI(self)
-        return self._applications
+        return ApplicationsAPI(self)
+
+    def close(self) -> None:
+        """Stop background token refresh and release pooled connections.
+
+        A session passed in by the caller is left open.
+        """
+        self._auth.close()
+        if self._owns_session:
+            self._session.close()
 
     # ------------------------------------------------------------------
     # HTTP helpers
@@ -86,32 +181,92 @@ class IGAClient:
         Uses ``_pageSize`` and ``_pagedResultsOffset`` parameters.
         Returns the combined ``result`` list across all pages.
         """
-        page_size = page_size or self.page_size
-        params = dict(params or {})
-        params["_pageSize"] = page_size
-        offset = params.pop("_pagedResultsOffset", 0)
+        return list(self.iter_paginated(path, params=params, page_size=page_size, max_pages=max_pages))
 
-        all_results: list[dict] = []
-        pages_fetched = 0
+    def iter_paginated(
+        self,
+        path: str,
+        params: dict | None = None,
+        page_size: int | None = None,
+        max_pages: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield records from a paginated list endpoint as each page arrives.
+
+        If the server rejects the first request with an HTTP 400 that refers
+        to the page size, the page size is halved (down to ``MIN_PAGE_SIZE``)
+        and the request retried.
+
+        The first page is fetched on its own; its ``totalCount`` fixes every
+        remaining offset, so those pages are then requested concurrently
+        (up to ``max_workers`` at a time) and yielded in offset order. At most
+        ``2 * max_workers`` pages are fetched ahead of the caller; the next
+        is requested only as one is consumed. Nothing is requested until the
+        caller starts consuming the iterator, and unstarted page requests are
+        cancelled if it stops early.
+        """
+        use_default = page_size is None
+        page_size = page_size or self.page_size
+        params = params or {}
+        offset = params.get("_pagedResultsOffset", 0)
+        # Per-page params are built from this template and never mutate it,
+        # so it is safe to share with the page-fetching threads below
+        base_params = {k: v for k, v in params.items() if k != "_pagedResultsOffset"}
+        base_params["_pageSize"] = page_size
 
         while True:
-            params["_pagedResultsOffset"] = offset
-            body = self.api_get(path, params=params)
-
-            results = body.get("result", [])
-            all_results.extend(results)
-            pages_fetched += 1
-
-            total = body.get("totalCount", 0)
-            if not results or len(all_results) >= total:
-                break
-            if max_pages and pages_fetched >= max_pages:
-                log.info("Stopped pagination after %d pages (%d/%d results)", pages_fetched, len(all_results), total)
+            try:
+                body = self.api_get(path, params={**base_params, "_pagedResultsOffset": offset})
                 break
-
-            offset += page_size
-
-        return all_results
+            except IGAClientError as exc:
+                # Some tenants cap _pageSize and answer 400; halve and retry.
+                # Other 400s (e.g. a bad _queryFilter) are not ours to fix.
+                if exc.status_code != 400 or page_size <= MIN_PAGE_SIZE or not _is_page_size_error(exc):
+                    raise
+                page_size = max(page_size // 2, MIN_PAGE_SIZE)
+                base_params = {**base_params, "_pageSize": page_size}
+                log.warning("Server rejected page size; retrying with _pageSize=%d", page_size)
+
+        # Only remember a smaller default once the server has accepted it
+        if use_default and page_size != self.page_size:
+            self.page_size = page_size
+
+        results = body.get("result", [])
+        yield from results
+
+        total = body.get("totalCount", 0)
+        if not results or len(results) >= total:
+            return
+
+        # Step by what the server actually returned, in case it clamps _pageSize
+        step = len(results)
+        offsets = list(range(offset + step, total, step))
+        if max_pages and len(offsets) >= max_pages:
+            offsets = offsets[:max_pages - 1]
+            log.info("Stopping pagination after %d pages (%d total results)", max_pages, total)
+        if not offsets:
+            return
+
+        def fetch(page_offset: int) -> dict:
+            return self.api_get(path, params={**base_params, "_pagedResultsOffset": page_offset})
+
+        workers = min(self.max_workers, len(offsets))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        # Keep a bounded window of requests in flight so a slow consumer
+        # never has more than that many pages buffered ahead of it
+        remaining = iter(offsets)
+        window = deque(executor.submit(fetch, o) for _, o in zip(range(workers * 2), remaining))
+        try:
+            while window:
+                body = window.popleft().result()
+                results = body.get("result", [])
+                if not results:
+                    break
+                next_offset = next(remaining, None)
+                if next_offset is not None:
+                    window.append(executor.submit(fetch, next_offset))
+                yield from results
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     # ------------------------------------------------------------------
     # Internal
@@ -119,30 +274,35 @@ class IGAClient:
 
     def _build_url(self, path: str) -> str:
         # Paths from the OpenAPI spec are relative to /iga
-        if not path.startswith("/"):
-            path = f"/{path}"
-        if not path.startswith("/iga"):
-            path = f"/iga{path}"
-        return f"{self.base_url}{path}"
-
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._auth.access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-
-    def _request(self, method: str, path: str, **kwargs) -> dict:
+        if path[:1] != "/":
+            path = "/" + path
+        if path.startswith("/iga"):
+            return self.base_url + path
+        return self._url_prefix + path
+
+    def _request(self, method: str, path: str, headers: dict[str, str] | None = None, **kwargs) -> dict:
         url = self._build_url(path)
-        headers = self._headers()
+        # Static headers live on the session; only Authorization varies
+        request_headers = {"Authorization": self._auth.authorization_header}
 
-        # For multipart uploads, drop Content-Type so requests sets it
+        # For multipart uploads, unset the session's JSON Content-Type so
+        # requests can set the multipart boundary itself
         if "files" in kwargs:
-            headers.pop("Content-Type", None)
+            request_headers["Content-Type"] = None
+        if headers:
+            request_headers.update(headers)
+        # Serialize JSON bodies ourselves; the session already sends
+        # Content-Type: application/json
+        body = kwargs.pop("json", None)
+        if body is not None:
+            try:
+                kwargs["data"] = _json_dumps(body)
+            except (TypeError, ValueError) as exc:
+                raise IGAClientError(f"Request body is not JSON serializable: {exc}") from exc
 
         log.debug("%s %s", method, url)
         try:
-            resp = self._session.request(method, url, headers=headers, timeout=60, **kwargs)
+            resp = self._session.request(method, url, headers=request_headers, timeout=60, **kwargs)
         except requests.RequestException as exc:
             raise IGAClientError(f"Request failed: {exc}") from exc
 
@@ -162,21 +322,25 @@ class IGAClient:
                 details = []
             raise IGAClientError(message, status_code=resp.status_code, details=details)
 
-        if resp.status_code == 204 or not resp.content:
+        content = resp.content
+        if resp.status_code == 204 or not content:
             return {}
 
-        return resp.json()
+        # Decode the raw bytes directly rather than via resp.text
+        return _json_loads(content)
 
     @staticmethod
-    def _build_session() -> requests.Session:
+    def _build_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
         session = requests.Session()
-        retry = Retry(
-            total=MAX_RETRIES,
-            backoff_factor=RETRY_BACKOFF,
-            status_forcelist=RETRY_STATUS_CODES,
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
+        session.headers.update(_JSON_HEADERS)
+        # Size the pool for concurrent pagination/push so sockets are reused
+        # rather than opened and discarded per request
+        adapter = _KeepAliveAdapter(
+            max_retries=_RETRY,
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
\ No newline at end of file
@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from .exceptions import IGAClientError, IGANotFoundError
+from .exceptions import IGAClientError
 
 if TYPE_CHECKING:
+    from .applications import ApplicationsAPI
     from .client import IGAClient
 
 log = logging.getLogger(__name__)
@@ -71,6 +73,10 @@ class DisconnectedApplication:
         result = app.push(client)
     """
 
+    # Upserting an existing application is always logged, but only raises
+    # a UserWarning the first time per process
+    _upsert_warned = False
+
     def __init__(
         self,
         name: str,
@@ -88,6 +94,38 @@ class DisconnectedApplication:
         self._object_types: dict[str, ObjectTypeDefinition] = {}
         self._file_uploads: list[FileUpload] = []
 
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> DisconnectedApplication:
+        """Build an application from a parsed config dict in one pass.
+
+        Expects the layout used by ``gia app create`` / ``gia app get --export``:
+        ``name``, optional ``description``, ``owner_ids`` and ``icon``, and an
+        ``object_types`` mapping of object type ID to ``{type, properties}``.
+
+        Args:
+            config: The parsed config mapping.
+
+        Returns:
+            A new :class:`DisconnectedApplication` with its object types set.
+        """
+        app = cls(
+            name=config["name"],
+            description=config.get("description", ""),
+            owner_ids=config.get("owner_ids"),
+            icon=config.get("icon") or "",
+        )
+        # Mapping keys are already unique, so the duplicate check in
+        # add_object_type is not needed here
+        app._object_types = {
+            type_id: ObjectTypeDefinition(
+                id=type_id,
+                type=type_config["type"],
+                properties=type_config.get("properties") or {},
+            )
+            for type_id, type_config in (config.get("object_types") or {}).items()
+        }
+        return app
+
     # ------------------------------------------------------------------
     # Builder methods
     # ------------------------------------------------------------------
@@ -181,7 +219,14 @@ class DisconnectedApplication:
     # Push orchestration
     # ------------------------------------------------------------------
 
-    def push(self, client: IGAClient, upsert: bool = True) -> PushResult:
+    def push(
+        self,
+        client: IGAClient,
+        upsert: bool = True,
+        max_workers: int = 8,
+        push_bulk_object_types: bool = True,
+        parallel_uploads: int = 4,
+    ) -> PushResult:
         """Push this application to PingOne IGA.
 
         Orchestrates: create/update application → add/update object types
@@ -189,8 +234,15 @@ class DisconnectedApplication:
 
         Args:
             client: An authenticated :class:`~gia.client.IGAClient`.
-            upsert: If ``True`` (default), warn and update if the application
-                    already exists. If ``False``, raise an error on conflict.
+            upsert: If ``True`` (default), log a warning and update if the
+                    application already exists. If ``False``, raise an error on conflict.
+            max_workers: Maximum number of concurrent object type requests.
+            push_bulk_object_types: If ``True`` (default), rely on the
+                    ``objectTypes`` embedded in the application payload and
+                    only push individually the types the server did not
+                    echo back. If ``False``, always push each object type
+                    with its own request.
+            parallel_uploads: Maximum number of concurrent CSV uploads.
 
         Returns:
             A :class:`PushResult` with the application ID and upload responses.
@@ -207,10 +259,13 @@ class DisconnectedApplication:
                     f"Application '{self.name}' already exists (id={existing['id']}). "
                     "Set upsert=True to update."
                 )
-            warnings.warn(
-                f"Application '{self.name}' already exists (id={existing['id']}). Updating.",
-                stacklevel=2,
-            )
+            log.warning("Application '%s' already exists (id=%s). Updating.", self.name, existing["id"])
+            if not DisconnectedApplication._upsert_warned:
+                DisconnectedApplication._upsert_warned = True
+                warnings.warn(
+                    f"Application '{self.name}' already exists (id={existing['id']}). Updating.",
+                    stacklevel=2,
+                )
             app_id = existing["id"]
             app_response = apps_api.update_application(app_id, app_payload)
             log.info("Updated application '%s' (%s)", self.name, app_id)
@@ -219,27 +274,37 @@ class DisconnectedApplication:
             app_id = app_response["id"]
             log.info("Created application '%s' (%s)", self.name, app_id)
 
-        # Step 2: Add/update object types
-        object_type_responses = {}
-        for ot in self._object_types.values():
-            try:
-                existing_ot = apps_api.get_object_type(app_id, ot.id)
-                resp = apps_api.update_object_type(app_id, ot.id, ot.to_dict())
-                log.info("Updated object type '%s' on application '%s'", ot.id, self.name)
-            except IGANotFoundError:
-                resp = apps_api.add_object_type(app_id, ot.to_dict())
-                log.info("Added object type '%s' to application '%s'", ot.id, self.name)
-            object_type_responses[ot.id] = resp
-
-        # Step 3: Upload files
+        # Step 2: Add/update object types. The application payload already
+        # carries them; anything the server did not echo back is pushed
+        # individually (independent calls, run concurrently).
+        object_type_responses: dict[str, dict] = {}
+        if push_bulk_object_types:
+            embedded = app_response.get("objectTypes") or {}
+            for ot_id in self._object_types:
+                if ot_id in embedded:
+                    object_type_responses[ot_id] = embedded[ot_id]
+        object_types = [
+            ot for ot in self._object_types.values() if ot.id not in object_type_responses
+        ]
+        if object_types:
+            # One read of the application tells us which types already exist.
+            existing_app = apps_api.get_application(app_id, fields="objectTypes")
+            existing_types = set(existing_app.get("objectTypes") or {})
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = executor.map(
+                    lambda ot: self._push_object_type(apps_api, app_id, ot, ot.id in existing_types),
+                    object_types,
+                )
+                object_type_responses.update(zip((ot.id for ot in object_types), responses))
+
+        # Step 3: Upload files (independent POSTs, run concurrently, results in input order)
         upload_responses = []
-        for upload in self._file_uploads:
-            resp = apps_api.upload_file(app_id, upload.file_path, upload.object_type)
-            log.info(
-                "Uploaded '%s' for object type '%s' on application '%s'",
-                upload.file_path, upload.object_type, self.name,
-            )
-            upload_responses.append(resp)
+        if self._file_uploads:
+            workers = max(1, min(parallel_uploads, len(self._file_uploads)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                upload_responses = list(executor.map(
+                    lambda upload: self._upload_file(apps_api, app_id, upload), self._file_uploads
+                ))
 
         return PushResult(
             application_id=app_id,
@@ -248,6 +313,31 @@ class DisconnectedApplication:
             upload_responses=upload_responses,
         )
 
+    def _push_object_type(
+        self,
+        apps_api: ApplicationsAPI,
+        app_id: str,
+        ot: ObjectTypeDefinition,
+        exists: bool,
+    ) -> dict:
+        """Update ``ot`` if it already exists on the application, else add it."""
+        if exists:
+            resp = apps_api.update_object_type(app_id, ot.id, ot.to_dict())
+            log.info("Updated object type '%s' on application '%s'", ot.id, self.name)
+        else:
+            resp = apps_api.add_object_type(app_id, ot.to_dict())
+            log.info("Added object type '%s' to application '%s'", ot.id, self.name)
+        return resp
+
+    def _upload_file(self, apps_api: ApplicationsAPI, app_id: str, upload: FileUpload) -> dict:
+        """Upload one queued CSV file."""
+        resp = apps_api.upload_file(app_id, upload.file_path, upload.object_type)
+        log.info(
+            "Uploaded '%s' for object type '%s' on application '%s'",
+            upload.file_path, upload.object_type, self.name,
+        )
+        return resp
+
 
 @dataclass
 class PushResult:
@@ -0,0 +1,29 @@
+"""YAML load/dump helpers for the CLI.
+
+Routes all YAML I/O through PyYAML's libyaml-backed ``CSafeLoader`` /
+``CSafeDumper`` when available, falling back to the pure-Python safe
+loader/dumper otherwise.
+"""
+
+from typing import Any, IO
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeLoader as Loader, SafeDumper as Dumper
+
+
+def load(stream: str | bytes | IO) -> Any:
+    """Parse a single YAML document from a string, bytes, or file object."""
+    return yaml.load(stream, Loader=Loader)
+
+
+def dump(data: Any, stream: IO | None = None, **kwargs: Any) -> str | None:
+    """Serialize ``data`` as YAML.
+
+    Accepts the usual PyYAML emitter kwargs (``default_flow_style``,
+    ``sort_keys``, ...). Returns the YAML string when ``stream`` is ``None``.
+    """
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
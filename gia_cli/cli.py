@@ -1,17 +1,31 @@
 """GIA CLI - Command-line interface for Governance Identity API."""
 
+from __future__ import annotations
+
+import itertools
 import sys
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
 
 import click
-import yaml
-
-from gia import IGAClient, DisconnectedApplication
-from gia.exceptions import IGAClientError, IGANotFoundError
 
 from .config import ConfigManager
-from .interactive import InteractiveAppBuilder
-from .utils import format_table, success, error, info, warning
+from .utils import BatchedOutput, format_table, success, error, info, warning
+
+# The client library, YAML and the interactive builder are imported inside
+# the commands that need them so that ``--help`` and ``configure`` stay fast.
+if TYPE_CHECKING:
+    from gia import IGAClient, DisconnectedApplication
+
+# Upper bound on concurrent API calls issued by a single command
+_MAX_WORKERS = 8
+
+# Shared by every command that talks to the API
+_profile_option = click.option("--profile", default="default", help="Configuration profile to use")
+
+_FORMAT_TABLE = click.Choice(["table", "json", "yaml"])
+_FORMAT_DATA = click.Choice(["json", "yaml", "table"])
+_FORMAT_EXPORT = click.Choice(["json", "yaml"])
 
 
 @click.group()
@@ -31,26 +45,7 @@ def cli():
 def configure(profile):
     """Configure GIA credentials interactively."""
     config_mgr = ConfigManager()
-    
-    click.echo(f"\n🔧 Configuring GIA profile: {profile}\n")
-    
-    base_url = click.prompt("Base URL (e.g., https://tenant.forgeblocks.com)")
-    client_id = click.prompt("Client ID")
-    client_secret = click.prompt("Client Secret", hide_input=True)
-    token_endpoint = click.prompt(
-        "Token Endpoint",
-        default=f"{base_url.rstrip('/')}/am/oauth2/access_token"
-    )
-    scopes = click.prompt("Scopes (optional)", default="", show_default=False)
-    
-    config_mgr.set_profile(
-        profile,
-        base_url=base_url,
-        client_id=client_id,
-        client_secret=client_secret,
-        token_endpoint=token_endpoint,
-        scopes=scopes or None
-    )
+    config_mgr.interactive_configure(profile)
     
     success(f"Configuration saved for profile '{profile}'")
     info(f"Config location: {config_mgr.config_path}")
@@ -68,23 +63,31 @@ def app():
 
 
 @app.command("list")
-@click.option("--profile", default="default", help="Configuration profile to use")
-@click.option("--format", type=click.Choice(["table", "json", "yaml"]), default="table")
-def app_list(profile, format):
+@_profile_option
+@click.option("--format", type=_FORMAT_TABLE, default="table")
+@click.option("--detailed", is_flag=True, help="Fetch full details for every application")
+def app_list(profile, format, detailed):
     """List all applications."""
+    from gia.exceptions import IGAClientError
+
     client = _get_client(profile)
     
     try:
         apps = client.applications.list_applications()
+        if detailed:
+            apps = client.applications.batch_get([app["id"] for app in apps])
         
         if format == "json":
-            import json
-            click.echo(json.dumps(apps, indent=2))
+            click.echo(_json_dumps(apps))
         elif format == "yaml":
-            click.echo(yaml.dump(apps, default_flow_style=False))
+            _yaml_dump(apps, sys.stdout)
         else:
             headers = ["ID", "Name", "Description"]
             rows = [[app.get("id", ""), app.get("name", ""), app.get("description", "")] for app in apps]
+            if detailed:
+                headers.append("Object Types")
+                for row, app in zip(rows, apps):
+                    row.append(len(app.get("objectTypes") or {}))
             click.echo(format_table(headers, rows))
             info(f"Total applications: {len(apps)}")
     except IGAClientError as e:
@@ -93,32 +96,45 @@ def app_list(profile, format):
 
 
 @app.command("get")
-@click.argument("app_id")
-@click.option("--profile", default="default", help="Configuration profile to use")
-@click.option("--export", type=click.Path(), help="Export to YAML file")
-@click.option("--format", type=click.Choice(["json", "yaml"]), default="yaml")
-def app_get(app_id, profile, export, format):
-    """Get application details by ID."""
+@click.argument("app_ids", nargs=-1, required=True)
+@_profile_option
+@click.option("--export", type=click.Path(), help="Export to YAML file (single ID only)")
+@click.option("--format", type=_FORMAT_EXPORT, default="yaml")
+def app_get(app_ids, profile, export, format):
+    """Get application details by one or more IDs."""
+    from gia.exceptions import IGAClientError, IGANotFoundError
+
+    # An export must round-trip through "gia app create", which takes one app
+    if export and len(app_ids) > 1:
+        error("--export takes a single application ID")
+        sys.exit(1)
+
     client = _get_client(profile)
     
     try:
-        app_data = client.applications.get_application(app_id)
+        if len(app_ids) == 1:
+            apps = [client.applications.get_application(app_ids[0])]
+        else:
+            apps = client.applications.batch_get(list(app_ids))
         
         # Convert to friendly YAML structure
-        config_data = _app_to_config(app_data)
+        configs = [_app_to_config(app_data) for app_data in apps]
+        config_data = configs[0] if len(configs) == 1 else configs
         
         if export:
-            with open(export, "w") as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            with open(export, "w", buffering=1 << 16) as f:
+                _yaml_dump(config_data, f)
             success(f"Application exported to {export}")
         else:
             if format == "json":
-                import json
-                click.echo(json.dumps(config_data, indent=2))
+                click.echo(_json_dumps(config_data))
             else:
-                click.echo(yaml.dump(config_data, default_flow_style=False, sort_keys=False))
+                _yaml_dump(config_data, sys.stdout)
     except IGANotFoundError:
-        error(f"Application '{app_id}' not found")
+        if len(app_ids) == 1:
+            error(f"Application '{app_ids[0]}' not found")
+        else:
+            error(f"One or more applications not found: {', '.join(app_ids)}")
         sys.exit(1)
     except IGAClientError as e:
         error(f"Failed to get application: {e}")
@@ -127,13 +143,17 @@ def app_get(app_id, profile, export, format):
 
 @app.command("create")
 @click.argument("config_file", type=click.Path(exists=True), required=False)
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 @click.option("--interactive", "-i", is_flag=True, help="Interactive mode")
 def app_create(config_file, profile, interactive):
     """Create an application from YAML config or interactively."""
+    from gia.exceptions import IGAClientError
+
     client = _get_client(profile)
     
     if interactive:
+        from .interactive import InteractiveAppBuilder
+
         builder = InteractiveAppBuilder()
         app = builder.build()
     elif config_file:
@@ -157,18 +177,21 @@ def app_create(config_file, profile, interactive):
 @app.command("update")
 @click.argument("app_id")
 @click.argument("config_file", type=click.Path(exists=True))
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 def app_update(app_id, config_file, profile):
     """Update an application from YAML config."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from gia.exceptions import IGAClientError, IGANotFoundError
+
     client = _get_client(profile)
     
     # Load config
     app = _load_app_from_config(config_file)
     
     try:
-        # Force the app to update by setting upsert=True
-        # But first check if it exists
-        existing = client.applications.get_application(app_id)
+        # Confirm the application exists before replacing it
+        client.applications.get_application(app_id)
         
         # Update the application
         payload = app.to_application_payload()
@@ -176,15 +199,31 @@ def app_update(app_id, config_file, profile):
         
         success(f"Application '{app_id}' updated successfully!")
         
-        # Update object types
-        for ot_id, ot_def in app.object_types.items():
-            try:
-                client.applications.get_object_type(app_id, ot_id)
+        # The full-replace PUT already carries objectTypes, so decide update
+        # versus add from what exists after it, not before. Use the response
+        # when it echoes them, else read them once (no per-type probes).
+        after_types = updated.get("objectTypes")
+        if after_types is None:
+            after_types = client.applications.get_application(app_id, fields="objectTypes").get("objectTypes")
+        existing_types = set(after_types or {})
+        
+        # Update object types. Each one is an independent round trip, so run
+        # them concurrently; the token was already fetched by the calls above.
+        def sync_object_type(ot_id, ot_def):
+            if ot_id in existing_types:
                 client.applications.update_object_type(app_id, ot_id, ot_def.to_dict())
-                info(f"Updated object type: {ot_id}")
-            except IGANotFoundError:
-                client.applications.add_object_type(app_id, ot_def.to_dict())
-                info(f"Added new object type: {ot_id}")
+                return f"Updated object type: {ot_id}"
+            client.applications.add_object_type(app_id, ot_def.to_dict())
+            return f"Added new object type: {ot_id}"
+        
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(sync_object_type, ot_id, ot_def)
+                for ot_id, ot_def in app.object_types.items()
+            ]
+            with BatchedOutput() as out:
+                for future in as_completed(futures):
+                    out.info(future.result())
         
     except IGANotFoundError:
         error(f"Application '{app_id}' not found")
@@ -196,10 +235,12 @@ def app_update(app_id, config_file, profile):
 
 @app.command("delete")
 @click.argument("app_id")
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
 def app_delete(app_id, profile, yes):
     """Delete an application."""
+    from gia.exceptions import IGAClientError, IGANotFoundError
+
     client = _get_client(profile)
     
     if not yes:
@@ -230,13 +271,16 @@ def object():
 @object.command("add")
 @click.argument("app_id")
 @click.argument("config_file", type=click.Path(exists=True))
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 def object_add(app_id, config_file, profile):
     """Add an object type to an application."""
+    from gia.exceptions import IGAClientError
+    from . import _yaml as yaml
+
     client = _get_client(profile)
     
     with open(config_file) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f)
     
     try:
         result = client.applications.add_object_type(app_id, config)
@@ -250,13 +294,16 @@ def object_add(app_id, config_file, profile):
 @click.argument("app_id")
 @click.argument("type_id")
 @click.argument("config_file", type=click.Path(exists=True))
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 def object_update(app_id, type_id, config_file, profile):
     """Update an object type."""
+    from gia.exceptions import IGAClientError, IGANotFoundError
+    from . import _yaml as yaml
+
     client = _get_client(profile)
     
     with open(config_file) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f)
     
     try:
         result = client.applications.update_object_type(app_id, type_id, config)
@@ -272,10 +319,12 @@ def object_update(app_id, type_id, config_file, profile):
 @object.command("delete")
 @click.argument("app_id")
 @click.argument("type_id")
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
 def object_delete(app_id, type_id, profile, yes):
     """Delete an object type from an application."""
+    from gia.exceptions import IGAClientError, IGANotFoundError
+
     client = _get_client(profile)
     
     if not yes:
@@ -307,9 +356,11 @@ def data():
 @click.argument("app_id")
 @click.argument("csv_file", type=click.Path(exists=True))
 @click.option("--type", "object_type", required=True, help="Object type (e.g., __ACCOUNT__)")
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 def data_load(app_id, csv_file, object_type, profile):
     """Upload CSV data for an application object type."""
+    from gia.exceptions import IGAClientError
+
     client = _get_client(profile)
     
     try:
@@ -330,29 +381,31 @@ def data_load(app_id, csv_file, object_type, profile):
 @data.command("status")
 @click.argument("app_id")
 @click.argument("upload_id")
-@click.option("--profile", default="default", help="Configuration profile to use")
-@click.option("--format", type=click.Choice(["json", "yaml", "table"]), default="table")
+@_profile_option
+@click.option("--format", type=_FORMAT_DATA, default="table")
 def data_status(app_id, upload_id, profile, format):
     """Check upload progress status."""
+    from gia.exceptions import IGAClientError, IGANotFoundError
+
     client = _get_client(profile)
     
     try:
         status = client.applications.get_upload_status(app_id, upload_id)
         
         if format == "json":
-            import json
-            click.echo(json.dumps(status, indent=2))
+            click.echo(_json_dumps(status))
         elif format == "yaml":
-            click.echo(yaml.dump(status, default_flow_style=False))
+            _yaml_dump(status, sys.stdout)
         else:
             click.echo(f"\n📊 Upload Status for {upload_id}\n")
             click.echo(f"Application ID: {app_id}")
+            failure_count = status.get('failureCount', 0)
             click.echo(f"Status: {status.get('status', 'unknown')}")
             click.echo(f"Total Records: {status.get('totalCount', 0)}")
             click.echo(f"Success: {status.get('successCount', 0)}")
-            click.echo(f"Failures: {status.get('failureCount', 0)}")
+            click.echo(f"Failures: {failure_count}")
             
-            if status.get('failureCount', 0) > 0:
+            if failure_count > 0:
                 warning(f"\nUse 'gia data failures {app_id} {upload_id}' to view errors")
     except IGANotFoundError:
         error(f"Upload '{upload_id}' not found for application '{app_id}'")
@@ -365,44 +418,49 @@ def data_status(app_id, upload_id, profile, format):
 @data.command("failures")
 @click.argument("app_id")
 @click.argument("upload_id")
-@click.option("--profile", default="default", help="Configuration profile to use")
+@_profile_option
 @click.option("--export", type=click.Path(), help="Export failures to CSV file")
-@click.option("--format", type=click.Choice(["json", "yaml", "table"]), default="table")
+@click.option("--format", type=_FORMAT_DATA, default="table")
 def data_failures(app_id, upload_id, profile, export, format):
     """View upload failure records."""
+    from gia.exceptions import IGAClientError, IGANotFoundError
+
     client = _get_client(profile)
     
     try:
-        failures_data = client.applications.get_upload_failures(app_id, upload_id)
-        failures = failures_data.get("result", [])
+        # Stream records page by page; only the pages actually consumed are fetched
+        failures = client.applications.iter_upload_failures(app_id, upload_id)
+        first = next(failures, None)
         
-        if not failures:
+        if first is None:
             success("No failures found for this upload")
             return
         
+        failures = itertools.chain([first], failures)
+        
         if export:
             import csv
-            with open(export, "w", newline="") as f:
-                if failures:
-                    writer = csv.DictWriter(f, fieldnames=failures[0].keys())
-                    writer.writeheader()
-                    writer.writerows(failures)
+            fields = list(first.keys())
+            with open(export, "w", newline="", buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                writer.writerows([row.get(k, "") for k in fields] for row in failures)
             success(f"Failures exported to {export}")
         else:
             if format == "json":
-                import json
-                click.echo(json.dumps(failures, indent=2))
+                click.echo(_json_dumps(list(failures)))
             elif format == "yaml":
-                click.echo(yaml.dump(failures, default_flow_style=False))
+                _yaml_dump(list(failures), sys.stdout)
             else:
-                click.echo(f"\n❌ Upload Failures ({len(failures)} records)\n")
-                for idx, failure in enumerate(failures[:10], 1):  # Show first 10
-                    click.echo(f"{idx}. Row: {failure.get('rowNumber', 'N/A')}")
-                    click.echo(f"   Error: {failure.get('error', 'No error message')}")
-                    click.echo()
-                
-                if len(failures) > 10:
-                    info(f"Showing 10 of {len(failures)} failures. Use --export to get all.")
+                with BatchedOutput() as out:
+                    out.echo("\n❌ Upload Failures\n")
+                    for idx, failure in enumerate(itertools.islice(failures, 10), 1):  # Show first 10
+                        out.echo(f"{idx}. Row: {failure.get('rowNumber', 'N/A')}")
+                        out.echo(f"   Error: {failure.get('error', 'No error message')}")
+                        out.echo()
+                    
+                    if next(failures, None) is not None:
+                        out.info("Showing the first 10 failures. Use --export to get all.")
     except IGANotFoundError:
         error(f"Upload '{upload_id}' not found or has no failures")
         sys.exit(1)
@@ -416,8 +474,36 @@ def data_failures(app_id, upload_id, profile, export, format):
 # ============================================================================
 
 
+def _yaml_dump(data: Any, stream: IO | None = None) -> str | None:
+    """Serialize ``data`` as block-style YAML, keeping the API's key order."""
+    from . import _yaml as yaml
+
+    return yaml.dump(data, stream, default_flow_style=False, sort_keys=False)
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialize ``data`` as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+_clients: dict[str, IGAClient] = {}
+
+
 def _get_client(profile: str) -> IGAClient:
-    """Get an authenticated IGAClient from config."""
+    """Get an authenticated IGAClient from config.
+
+    Clients are memoized per profile for the lifetime of the process.
+    """
+    if profile in _clients:
+        return _clients[profile]
+
+    from gia import IGAClient
+
     config_mgr = ConfigManager()
     
     try:
@@ -427,36 +513,26 @@ def _get_client(profile: str) -> IGAClient:
         info(f"Run 'gia configure' to set up credentials")
         sys.exit(1)
     
-    return IGAClient(
+    client = IGAClient(
         base_url=creds["base_url"],
         client_id=creds["client_id"],
         client_secret=creds["client_secret"],
         token_endpoint=creds["token_endpoint"],
         scopes=creds.get("scopes")
     )
+    _clients[profile] = client
+    return client
 
 
 def _load_app_from_config(config_file: str) -> DisconnectedApplication:
     """Load application from YAML config file."""
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
-    
-    app = DisconnectedApplication(
-        name=config["name"],
-        description=config.get("description", ""),
-        owner_ids=config.get("owner_ids"),
-        icon=config.get("icon")
-    )
-    
-    # Add object types
-    for type_id, type_config in config.get("object_types", {}).items():
-        app.add_object_type(
-            id=type_id,
-            type=type_config["type"],
-            properties=type_config.get("properties", {})
-        )
-    
-    return app
+    from gia import DisconnectedApplication
+
+    from . import _yaml as yaml
+
+    # Binary mode lets libyaml read the bytes without a text-decoding layer
+    with open(config_file, "rb") as f:
+        return DisconnectedApplication.from_config(yaml.load(f))
 
 
 def _app_to_config(app_data: dict) -> dict:
@@ -466,14 +542,17 @@ def _app_to_config(app_data: dict) -> dict:
         "description": app_data.get("description", ""),
     }
     
-    if app_data.get("ownerIds"):
-        config["owner_ids"] = app_data["ownerIds"]
+    owner_ids = app_data.get("ownerIds")
+    if owner_ids:
+        config["owner_ids"] = owner_ids
     
-    if app_data.get("icon"):
-        config["icon"] = app_data["icon"]
+    icon = app_data.get("icon")
+    if icon:
+        config["icon"] = icon
     
-    if app_data.get("objectTypes"):
-        config["object_types"] = app_data["objectTypes"]
+    object_types = app_data.get("objectTypes")
+    if object_types:
+        config["object_types"] = object_types
     
     return config
 
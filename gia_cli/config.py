@@ -1,10 +1,61 @@
 """Configuration management for GIA CLI."""
 
+import copy
+import json
 import os
+import tempfile
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
+import click
+
+_REQUIRED_PROFILE_FIELDS = frozenset(("base_url", "client_id", "client_secret", "token_endpoint"))
+
+
+@cache
+def _default_config_dir() -> Path:
+    """``~/.gia``, resolved once per process."""
+    return Path.home() / ".gia"
+
+
+_Profiles = tuple[Dict[str, Dict[str, str]], Dict[str, str]]
+
+
+def _validate_profiles(config: Dict[str, Any]) -> _Profiles:
+    """Split ``config``'s profiles into valid ones and error messages, by name."""
+    valid: Dict[str, Dict[str, str]] = {}
+    errors: Dict[str, str] = {}
+    for name, profile in (config.get("profiles") or {}).items():
+        missing = _REQUIRED_PROFILE_FIELDS.difference(profile)
+        if missing:
+            errors[name] = f"Profile '{name}' is missing required fields: {', '.join(sorted(missing))}"
+        else:
+            valid[name] = profile
+    return valid, errors
+
+
+def _as_config(document: Any, path: Path | str) -> Dict[str, Any]:
+    """Treat an empty (``null``) document as no config; reject non-mappings."""
+    if document is None:
+        return {}
+    if not isinstance(document, dict):
+        raise ValueError(f"Config file {path} must contain a mapping, not {type(document).__name__}")
+    return document
+
+
+@lru_cache(maxsize=8)
+def _read_config_cached(path: str, mtime_ns: int, size: int) -> tuple[Dict[str, Any], _Profiles]:
+    """Parse and validate a config file, memoized on its path, mtime and size.
+
+    Editing the file changes the cache key, so stale entries are never served.
+    Every ConfigManager in the process shares the result, so callers must
+    not mutate it.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    config = _as_config(json.loads(data), path) if data.strip() else {}
+    return config, _validate_profiles(config)
 
 
 class ConfigManager:
@@ -12,29 +63,97 @@ class ConfigManager:
     
     def __init__(self, config_dir: Path | None = None):
         if config_dir is None:
-            config_dir = Path.home() / ".gia"
+            config_dir = _default_config_dir()
+        elif not isinstance(config_dir, Path):
+            config_dir = Path(config_dir)
         
-        self.config_dir = Path(config_dir)
-        self.config_path = self.config_dir / "config.yaml"
+        self.config_dir = config_dir
+        self.config_path = self.config_dir / "config.json"
+        # Earlier releases stored profiles as YAML; migrated on first read
+        self.legacy_config_path = self.config_dir / "config.yaml"
         
-        # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Last config read or written by this instance, keyed on the file's
+        # (mtime_ns, size) so external edits are picked up
+        self._cache: Dict[str, Any] = {}
+        self._cache_key: tuple[int, int] | None = None
+        # Profiles from the cached config, validated once per parse
+        self._valid_profiles: Dict[str, Dict[str, str]] = {}
+        self._profile_errors: Dict[str, str] = {}
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        if not self.config_path.exists():
-            return {}
+        return copy.deepcopy(self._cached_config())
+    
+    def _cached_config(self) -> Dict[str, Any]:
+        """Return the parsed config, re-reading only if the file changed.
+        
+        The returned dict is shared with the cache and must not be mutated.
+        """
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            if self.legacy_config_path.exists():
+                self._migrate_legacy_config()
+                return self._cache
+            if self._cache_key is not None or self._cache:
+                self._set_cache({}, key=None)
+            return self._cache
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._cache_key:
+            # A zero-byte file (e.g. freshly touched) needs no open or parse
+            if st.st_size:
+                self._set_cache(*_read_config_cached(str(self.config_path), *key), key=key)
+            else:
+                self._set_cache({}, key=key)
+        return self._cache
+    
+    def _set_cache(
+        self,
+        config: Dict[str, Any],
+        profiles: _Profiles | None = None,
+        *,
+        key: tuple[int, int] | None,
+    ) -> None:
+        self._cache = config
+        self._cache_key = key
+        self._valid_profiles, self._profile_errors = profiles or _validate_profiles(config)
+    
+    def _migrate_legacy_config(self) -> None:
+        """Rewrite a ``config.yaml`` from an earlier release as ``config.json``."""
+        # PyYAML is only needed for this one-time conversion
+        from . import _yaml
         
-        with open(self.config_path) as f:
-            return yaml.safe_load(f) or {}
+        with open(self.legacy_config_path, "rb") as f:
+            config = _as_config(_yaml.load(f), self.legacy_config_path)
+        # YAML can hold values JSON cannot (e.g. unquoted dates); keep them as text
+        config = json.loads(json.dumps(config, default=str))
+        self.save_config(config)
+        self.legacy_config_path.unlink()
     
     def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file."""
-        with open(self.config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+        # Only writers need the directory; reads handle a missing file
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Write a uniquely named sibling temp file (mkstemp creates it user
+        # read/write only), then rename it into place so readers never see a
+        # partial or world-readable file and concurrent writers never share one
+        fd, tmp_name = tempfile.mkstemp(dir=self.config_dir, prefix=".config.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(config, f, indent=2)
+            # Stat our own file before the rename; afterwards config_path may
+            # already belong to another writer
+            st = tmp_path.stat()
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         
-        # Set restrictive permissions (user read/write only)
-        self.config_path.chmod(0o600)
+        # Seed the cache with what we just wrote so the next read skips parsing
+        self._set_cache(copy.deepcopy(config), key=(st.st_mtime_ns, st.st_size))
     
     def get_profile(self, profile_name: str = "default") -> Dict[str, str]:
         """Get a specific configuration profile.
@@ -48,25 +167,18 @@ class ConfigManager:
         Raises:
             ValueError: If profile doesn't exist or is invalid
         """
-        config = self.load_config()
-        
-        if "profiles" not in config or profile_name not in config["profiles"]:
-            raise ValueError(
-                f"Profile '{profile_name}' not found. Run 'gia configure' first."
-            )
-        
-        profile = config["profiles"][profile_name]
+        self._cached_config()
         
-        # Validate required fields
-        required = ["base_url", "client_id", "client_secret", "token_endpoint"]
-        missing = [field for field in required if field not in profile]
+        try:
+            return dict(self._valid_profiles[profile_name])
+        except KeyError:
+            pass
         
-        if missing:
-            raise ValueError(
-                f"Profile '{profile_name}' is missing required fields: {', '.join(missing)}"
-            )
-        
-        return profile
+        if profile_name in self._profile_errors:
+            raise ValueError(self._profile_errors[profile_name])
+        raise ValueError(
+            f"Profile '{profile_name}' not found. Run 'gia configure' first."
+        )
     
     def set_profile(
         self,
@@ -87,23 +199,57 @@ class ConfigManager:
             token_endpoint: OAuth2 token endpoint URL
             scopes: Optional OAuth2 scopes
         """
-        config = self.load_config()
-        
-        if "profiles" not in config:
-            config["profiles"] = {}
-        
-        config["profiles"][profile_name] = {
+        entry = {
             "base_url": base_url,
             "client_id": client_id,
             "client_secret": client_secret,
             "token_endpoint": token_endpoint,
         }
+        self.set_profiles({profile_name: entry | {"scopes": scopes} if scopes else entry})
+    
+    def set_profiles(self, profiles: Dict[str, Dict[str, str]]) -> None:
+        """Set or update several configuration profiles with a single write.
         
-        if scopes:
-            config["profiles"][profile_name]["scopes"] = scopes
+        Args:
+            profiles: Mapping of profile name to profile fields
+            
+        Raises:
+            ValueError: If any profile is missing required fields
+        """
+        _, errors = _validate_profiles({"profiles": profiles})
+        if errors:
+            raise ValueError(next(iter(errors.values())))
         
+        config = self.load_config()
+        config.setdefault("profiles", {}).update(profiles)
         self.save_config(config)
     
+    def interactive_configure(self, profile_name: str = "default") -> None:
+        """Prompt for credentials and save them as a profile.
+        
+        Args:
+            profile_name: Name of the profile to create or overwrite
+        """
+        click.echo(f"\n🔧 Configuring GIA profile: {profile_name}\n")
+        
+        base_url = click.prompt("Base URL (e.g., https://tenant.forgeblocks.com)")
+        client_id = click.prompt("Client ID")
+        client_secret = click.prompt("Client Secret", hide_input=True)
+        token_endpoint = click.prompt(
+            "Token Endpoint",
+            default=f"{base_url.rstrip('/')}/am/oauth2/access_token"
+        )
+        scopes = click.prompt("Scopes (optional)", default="", show_default=False)
+        
+        self.set_profile(
+            profile_name,
+            base_url=base_url,
+            client_id=client_id,
+            client_secret=client_secret,
+            token_endpoint=token_endpoint,
+            scopes=scopes or None
+        )
+    
     def list_profiles(self) -> list[str]:
         """List all configured profile names."""
         config = self.load_config()
@@ -1,8 +1,16 @@
 """Interactive mode for building applications."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import click
 
-from gia import DisconnectedApplication
+if TYPE_CHECKING:
+    from gia import DisconnectedApplication
+
+_OBJECT_TYPE_CHOICE = click.Choice(["account", "group", "resource", "permission"], case_sensitive=False)
+_PROPERTY_TYPE_CHOICE = click.Choice(["string", "number", "boolean", "array", "object"])
 
 
 class InteractiveAppBuilder:
@@ -10,6 +18,8 @@ class InteractiveAppBuilder:
     
     def build(self) -> DisconnectedApplication:
         """Build an application through interactive prompts."""
+        from gia import DisconnectedApplication
+
         click.echo("\n✨ Interactive Application Builder\n")
         
         # Basic app info
@@ -39,7 +49,7 @@ class InteractiveAppBuilder:
         type_id = click.prompt("Object type ID (e.g., __ACCOUNT__)")
         type_name = click.prompt(
             "Object type",
-            type=click.Choice(["account", "group", "resource", "permission"], case_sensitive=False),
+            type=_OBJECT_TYPE_CHOICE,
             default="account"
         )
         
@@ -57,7 +67,7 @@ class InteractiveAppBuilder:
                 
                 prop_type = click.prompt(
                     "Property type",
-                    type=click.Choice(["string", "number", "boolean", "array", "object"]),
+                    type=_PROPERTY_TYPE_CHOICE,
                     default="string"
                 )
                 
@@ -1,26 +1,86 @@
 """Utility functions for CLI output."""
 
+import os
+
 import click
 
 
+def _style(code: str, glyph: str) -> tuple[str, str]:
+    """Build the ANSI prefix/suffix for one message kind, once at import."""
+    if os.environ.get("NO_COLOR"):
+        return f"{glyph} ", ""
+    return f"\x1b[{code}m{glyph} ", "\x1b[0m"
+
+
+# click.echo still strips these codes when the stream is not a terminal
+_SUCCESS_PREFIX, _SUCCESS_SUFFIX = _style("32", "✓")
+_ERROR_PREFIX, _ERROR_SUFFIX = _style("31", "✗")
+_WARNING_PREFIX, _WARNING_SUFFIX = _style("33", "⚠")
+_INFO_PREFIX, _INFO_SUFFIX = _style("34", "ℹ")
+
+
 def success(message: str) -> None:
     """Print success message in green."""
-    click.echo(click.style(f"✓ {message}", fg="green"))
+    click.echo(f"{_SUCCESS_PREFIX}{message}{_SUCCESS_SUFFIX}")
 
 
 def error(message: str) -> None:
     """Print error message in red."""
-    click.echo(click.style(f"✗ {message}", fg="red"), err=True)
+    click.echo(f"{_ERROR_PREFIX}{message}{_ERROR_SUFFIX}", err=True)
 
 
 def warning(message: str) -> None:
     """Print warning message in yellow."""
-    click.echo(click.style(f"⚠ {message}", fg="yellow"))
+    click.echo(f"{_WARNING_PREFIX}{message}{_WARNING_SUFFIX}")
 
 
 def info(message: str) -> None:
     """Print info message in blue."""
-    click.echo(click.style(f"ℹ {message}", fg="blue"))
+    click.echo(f"{_INFO_PREFIX}{message}{_INFO_SUFFIX}")
+
+
+class BatchedOutput:
+    """Collect output lines and write them with a single ``click.echo``.
+    
+    Use around loops that print many lines::
+    
+        with BatchedOutput() as out:
+            for item in items:
+                out.info(f"Processed {item}")
+    
+    Anything collected is written when the block exits, including on error.
+    """
+    
+    def __init__(self):
+        self._lines: list[str] = []
+    
+    def __enter__(self) -> "BatchedOutput":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+    
+    def flush(self) -> None:
+        """Write all collected lines to stdout."""
+        if self._lines:
+            click.echo("\n".join(self._lines))
+            self._lines.clear()
+    
+    def echo(self, message: str = "") -> None:
+        """Queue a plain line."""
+        self._lines.append(message)
+    
+    def success(self, message: str) -> None:
+        """Queue a success message."""
+        self._lines.append(f"{_SUCCESS_PREFIX}{message}{_SUCCESS_SUFFIX}")
+    
+    def warning(self, message: str) -> None:
+        """Queue a warning message."""
+        self._lines.append(f"{_WARNING_PREFIX}{message}{_WARNING_SUFFIX}")
+    
+    def info(self, message: str) -> None:
+        """Queue an info message."""
+        self._lines.append(f"{_INFO_PREFIX}{message}{_INFO_SUFFIX}")
 
 
 def format_table(headers: list[str], rows: list[list[str]]) -> str:
@@ -36,29 +96,19 @@ def format_table(headers: list[str], rows: list[list[str]]) -> str:
     if not rows:
         return "No data"
     
-    # Calculate column widths
-    widths = [len(h) for h in headers]
-    
-    for row in rows:
-        for i, cell in enumerate(row):
-            if i < len(widths):
-                widths[i] = max(widths[i], len(str(cell)))
+    # Stringify once, then size each column from its transposed values
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(map(len, col)) for col in zip(headers, *str_rows)]
     
-    # Build separator
     separator = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    row_format = "| " + " | ".join("{:<%d}" % w for w in widths) + " |"
     
-    # Build header
-    header_row = "|" + "|".join(f" {h:<{widths[i]}} " for i, h in enumerate(headers)) + "|"
-    
-    # Build data rows
-    data_rows = []
-    for row in rows:
-        row_str = "|" + "|".join(
-            f" {str(cell):<{widths[i]}} " for i, cell in enumerate(row)
-        ) + "|"
-        data_rows.append(row_str)
-    
-    # Combine
-    lines = [separator, header_row, separator] + data_rows + [separator]
+    lines = [
+        separator,
+        row_format.format(*headers),
+        separator,
+        *(row_format.format(*row) for row in str_rows),
+        separator,
+    ]
     
     return "\n".join(lines)
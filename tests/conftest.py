@@ -0,0 +1,11 @@
+"""Fixtures shared across the test modules."""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def csv_file(tmp_path_factory):
+    """A small accounts CSV shared by the upload tests in a module."""
+    path = tmp_path_factory.mktemp("data") / "accounts.csv"
+    path.write_text("id,user_name\n1,alice\n")
+    return path
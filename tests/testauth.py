@@ -1,7 +1,8 @@
 """Tests for OAuth2 client credentials auth."""
 
 import time
-from unittest.mock import patch, MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 
@@ -9,65 +10,143 @@ from gia.auth import OAuth2ClientCredentials
 from gia.exceptions import IGAAuthError
 
 
+class FakeResponse:
+    """Minimal stand-in for a successful token endpoint ``requests.Response``."""
+
+    def __init__(self, json_data: dict):
+        self._json = json_data
+
+    def json(self) -> dict:
+        return self._json
+
+    def raise_for_status(self) -> None:
+        pass
+
+
 class TestOAuth2ClientCredentials:
 
-    def test_fetches_token_on_first_access(self):
+    @pytest.fixture(autouse=True)
+    def post_mock(self):
+        """Patch the token endpoint POST once per test; tests set its response."""
+        with patch("gia.auth.requests.post") as mock:
+            yield mock
+
+    def test_fetches_token_on_first_access(self, post_mock):
         auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
+        post_mock.return_value = FakeResponse({"access_token": "tok-123", "expires_in": 3600})
 
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"access_token": "tok-123", "expires_in": 3600}
-        mock_resp.raise_for_status = MagicMock()
+        token = auth.access_token
+        assert token == "tok-123"
+        post_mock.assert_called_once()
+        call_data = post_mock.call_args[1]["data"]
+        assert call_data["grant_type"] == "client_credentials"
+        assert call_data["client_id"] == "cid"
+        assert call_data["client_secret"] == "csec"
+
+    def test_caches_token(self, post_mock):
+        auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
+        post_mock.return_value = FakeResponse({"access_token": "tok-123", "expires_in": 3600})
 
-        with patch("gia.auth.requests.post", return_value=mock_resp) as mock_post:
-            token = auth.access_token
-            assert token == "tok-123"
-            mock_post.assert_called_once()
-            call_data = mock_post.call_args[1]["data"]
-            assert call_data["grant_type"] == "client_credentials"
-            assert call_data["client_id"] == "cid"
-            assert call_data["client_secret"] == "csec"
+        _ = auth.access_token
+        _ = auth.access_token
+        assert post_mock.call_count == 1
 
-    def test_caches_token(self):
+    def test_authorization_header_cached_with_token(self, post_mock):
         auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
+        post_mock.return_value = FakeResponse({"access_token": "tok-123", "expires_in": 3600})
 
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"access_token": "tok-123", "expires_in": 3600}
-        mock_resp.raise_for_status = MagicMock()
+        assert auth.authorization_header == "Bearer tok-123"
+        assert auth.authorization_header is auth.authorization_header
+        assert post_mock.call_count == 1
 
-        with patch("gia.auth.requests.post", return_value=mock_resp) as mock_post:
-            _ = auth.access_token
+    def test_concurrent_access_fetches_once(self, post_mock):
+        auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
+        mock_resp = FakeResponse({"access_token": "tok-123", "expires_in": 3600})
+
+        def slow_post(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_resp
+
+        post_mock.side_effect = slow_post
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: auth.access_token, range(8)))
+        assert tokens == ["tok-123"] * 8
+        assert post_mock.call_count == 1
+
+    def test_background_refresh_fetches_ahead_of_requests(self, post_mock):
+        post_mock.return_value = FakeResponse({"access_token": "tok-bg", "expires_in": 3600})
+
+        auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token", background_refresh=True)
+        try:
+            deadline = time.time() + 2
+            while auth._access_token is None and time.time() < deadline:
+                time.sleep(0.01)
+            assert auth.access_token == "tok-bg"
+        finally:
+            auth.close()
+        assert post_mock.call_count == 1
+        assert auth._refresh_thread is None
+
+    def test_background_refresh_paces_short_lived_tokens(self, post_mock, monkeypatch):
+        monkeypatch.setattr(OAuth2ClientCredentials, "REFRESH_RETRY_SECONDS", 0.2)
+        post_mock.return_value = FakeResponse({"access_token": "tok-short", "expires_in": 30})
+
+        auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token", background_refresh=True)
+        try:
+            time.sleep(0.5)
+        finally:
+            auth.close()
+        # Initial fetch plus at most a couple of paced refreshes, not a busy loop
+        assert 1 <= post_mock.call_count <= 3
+
+    def test_refresh_delay_for_short_lifetime(self):
+        auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
+        auth._access_token = "tok"
+        auth._expires_in = 30
+        auth._expires_at = time.time() + 30
+        assert 14 <= auth._next_refresh_delay() <= 15
+
+    def test_background_refresh_survives_malformed_response(self, post_mock, monkeypatch):
+        monkeypatch.setattr(OAuth2ClientCredentials, "REFRESH_RETRY_SECONDS", 0.05)
+        good = FakeResponse({"access_token": "tok-ok", "expires_in": 3600})
+        post_mock.side_effect = [FakeResponse({"error": "nope"}), good]
+
+        auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token", background_refresh=True)
+        try:
+            deadline = time.time() + 2
+            while auth._access_token is None and time.time() < deadline:
+                time.sleep(0.01)
+            assert auth._access_token == "tok-ok"
+        finally:
+            auth.close()
+
+    def test_malformed_response_raises_auth_error(self, post_mock):
+        auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
+        post_mock.return_value = FakeResponse({"error": "invalid_client"})
+        with pytest.raises(IGAAuthError, match="Malformed token response"):
             _ = auth.access_token
-            assert mock_post.call_count == 1
 
-    def test_refreshes_expired_token(self):
+    def test_refreshes_expired_token(self, post_mock):
         auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
         auth._access_token = "old"
         auth._expires_at = time.time() - 10  # already expired
+        post_mock.return_value = FakeResponse({"access_token": "new-tok", "expires_in": 3600})
 
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"access_token": "new-tok", "expires_in": 3600}
-        mock_resp.raise_for_status = MagicMock()
+        token = auth.access_token
+        assert token == "new-tok"
 
-        with patch("gia.auth.requests.post", return_value=mock_resp):
-            token = auth.access_token
-            assert token == "new-tok"
-
-    def test_includes_scopes_when_set(self):
+    def test_includes_scopes_when_set(self, post_mock):
         auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token", scopes="fr:idm:*")
+        post_mock.return_value = FakeResponse({"access_token": "tok", "expires_in": 3600})
 
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"access_token": "tok", "expires_in": 3600}
-        mock_resp.raise_for_status = MagicMock()
-
-        with patch("gia.auth.requests.post", return_value=mock_resp) as mock_post:
-            _ = auth.access_token
-            call_data = mock_post.call_args[1]["data"]
-            assert call_data["scope"] == "fr:idm:*"
+        _ = auth.access_token
+        call_data = post_mock.call_args[1]["data"]
+        assert call_data["scope"] == "fr:idm:*"
 
-    def test_raises_on_request_failure(self):
+    def test_raises_on_request_failure(self, post_mock):
         auth = OAuth2ClientCredentials("cid", "csec", "https://example.com/token")
 
         import requests as req
-        with patch("gia.auth.requests.post", side_effect=req.ConnectionError("nope")):
-            with pytest.raises(IGAAuthError, match="Token request failed"):
-                _ = auth.access_token
\ No newline at end of file
+        post_mock.side_effect = req.ConnectionError("nope")
+        with pytest.raises(IGAAuthError, match="Token request failed"):
+            _ = auth.access_token
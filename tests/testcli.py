@@ -0,0 +1,64 @@
+"""Tests for the ``gia`` command-line interface."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from gia_cli.cli import cli
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    with patch("gia_cli.cli._get_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    path = tmp_path / "app.yaml"
+    path.write_text(
+        "name: TestApp\n"
+        "object_types:\n"
+        "  __ACCOUNT__:\n"
+        "    type: account\n"
+        "    properties:\n"
+        "      id: {type: string}\n"
+        "  __GROUP__:\n"
+        "    type: group\n"
+        "    properties:\n"
+        "      id: {type: string}\n"
+    )
+    return path
+
+
+class TestAppUpdate:
+
+    def test_new_object_type_created_by_put_is_updated(self, mock_client, app_config):
+        # __GROUP__ is new in the config; the PUT creates it along with the app
+        apps = mock_client.applications
+        apps.get_application.return_value = {"id": "abc-123", "objectTypes": {"__ACCOUNT__": {}}}
+        apps.update_application.return_value = {
+            "id": "abc-123",
+            "objectTypes": {"__ACCOUNT__": {}, "__GROUP__": {}},
+        }
+        result = CliRunner().invoke(cli, ["app", "update", "abc-123", str(app_config)])
+        assert result.exit_code == 0, result.output
+        apps.add_object_type.assert_not_called()
+        assert {c.args[1] for c in apps.update_object_type.call_args_list} == {"__ACCOUNT__", "__GROUP__"}
+
+    def test_reads_object_types_after_put_when_not_echoed(self, mock_client, app_config):
+        apps = mock_client.applications
+        apps.get_application.side_effect = [
+            {"id": "abc-123", "objectTypes": {}},
+            {"objectTypes": {"__ACCOUNT__": {}}},
+        ]
+        apps.update_application.return_value = {"id": "abc-123"}
+        result = CliRunner().invoke(cli, ["app", "update", "abc-123", str(app_config)])
+        assert result.exit_code == 0, result.output
+        apps.get_application.assert_called_with("abc-123", fields="objectTypes")
+        apps.update_object_type.assert_called_once()
+        assert apps.update_object_type.call_args.args[1] == "__ACCOUNT__"
+        apps.add_object_type.assert_called_once()
+        assert apps.add_object_type.call_args.args[1]["id"] == "__GROUP__"
@@ -1,24 +1,31 @@
 """Tests for the thin REST client and applications API."""
 
 import json
-from unittest.mock import MagicMock, patch
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
 import pytest
+import requests
 
 from gia import IGAClient, IGAClientError, IGANotFoundError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_auth():
     """Patch OAuth2 so no real token fetch occurs."""
     with patch("gia.client.OAuth2ClientCredentials") as mock_cls:
         instance = mock_cls.return_value
         instance.access_token = "fake-token"
+        instance.authorization_header = "Bearer fake-token"
         yield instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(mock_auth):
+    """One client for the module; tests patch ``_request`` individually."""
     return IGAClient(
         base_url="https://tenant.example.com",
         client_id="cid",
@@ -27,6 +34,22 @@ def client(mock_auth):
     )
 
 
+@pytest.fixture
+def mock_req():
+    """Patch ``IGAClient._request`` for the duration of one test."""
+    with patch("gia.client.IGAClient._request") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_state(client):
+    """Undo the per-test state a shared client can pick up."""
+    page_size = client.page_size
+    yield
+    client.page_size = page_size
+    client.applications._app_by_name.clear()
+
+
 class TestClientURLBuilding:
 
     def test_builds_url_with_iga_prefix(self, client):
@@ -47,9 +70,66 @@ class TestClientURLBuilding:
             assert c.base_url == "https://example.com"
 
 
+class TestSession:
+
+    def test_static_headers_on_session(self, client):
+        assert client._session.headers["Accept"] == "application/json"
+        assert client._session.headers["Content-Type"] == "application/json"
+
+    def test_request_sends_only_authorization(self, client):
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value.status_code = 204
+            client._request("GET", "/governance/application")
+        assert mock_request.call_args[1]["headers"] == {"Authorization": "Bearer fake-token"}
+
+    def test_json_body_is_preserialized(self, client):
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value.status_code = 204
+            client._request("PUT", "/governance/application/abc-123", json={"name": "Ünïcode"})
+        kwargs = mock_request.call_args[1]
+        assert "json" not in kwargs
+        assert isinstance(kwargs["data"], bytes)
+        assert json.loads(kwargs["data"]) == {"name": "Ünïcode"}
+
+    def test_json_body_coerces_non_str_keys(self, client):
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value.status_code = 204
+            client._request("POST", "/governance/application", json={"properties": {1: {"type": "string"}}})
+        assert json.loads(mock_request.call_args[1]["data"]) == {"properties": {"1": {"type": "string"}}}
+
+    def test_unserializable_json_body_raises_client_error(self, client):
+        with patch.object(client._session, "request") as mock_request:
+            with pytest.raises(IGAClientError, match="not JSON serializable"):
+                client._request("POST", "/governance/application", json={"when": object()})
+        mock_request.assert_not_called()
+
+    def test_uses_provided_session(self, mock_auth):
+        session = requests.Session()
+        a = IGAClient("https://a.example.com", "cid", "csec", "https://a.example.com/token", session=session)
+        b = IGAClient("https://b.example.com", "cid", "csec", "https://b.example.com/token", session=session)
+        assert a._session is b._session is session
+        assert session.headers["Content-Type"] == "application/json"
+
+    def test_close_stops_auth_and_keeps_shared_session(self, mock_auth):
+        session = requests.Session()
+        c = IGAClient("https://a.example.com", "cid", "csec", "https://a.example.com/token", session=session)
+        with patch.object(session, "close") as session_close:
+            c.close()
+        mock_auth.close.assert_called()
+        session_close.assert_not_called()
+
+    def test_adapter_pool_sized_for_workers(self, client):
+        adapter = client._session.get_adapter("https://tenant.example.com")
+        assert adapter._pool_maxsize >= client.max_workers
+
+    def test_adapter_enables_tcp_keepalive(self, client):
+        adapter = client._session.get_adapter("https://tenant.example.com")
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+
 class TestApplicationsAPI:
 
-    @patch("gia.client.IGAClient._request")
     def test_create_application(self, mock_req, client):
         mock_req.return_value = {"id": "abc-123", "name": "TestApp"}
         result = client.applications.create_application({"name": "TestApp", "isDisconnected": True})
@@ -60,14 +140,12 @@ class TestApplicationsAPI:
         )
         assert result["id"] == "abc-123"
 
-    @patch("gia.client.IGAClient._request")
     def test_get_application(self, mock_req, client):
         mock_req.return_value = {"id": "abc-123", "name": "TestApp"}
         result = client.applications.get_application("abc-123")
         mock_req.assert_called_once_with("GET", "/governance/application/abc-123", params=None)
         assert result["name"] == "TestApp"
 
-    @patch("gia.client.IGAClient._request")
     def test_get_application_with_fields(self, mock_req, client):
         mock_req.return_value = {"name": "TestApp"}
         client.applications.get_application("abc-123", fields="name,id")
@@ -76,19 +154,45 @@ class TestApplicationsAPI:
             params={"_fields": "name,id"},
         )
 
-    @patch("gia.client.IGAClient._request")
+    def test_batch_get_preserves_order(self, mock_req, client):
+        mock_req.side_effect = lambda method, path, params=None: {"id": path.rsplit("/", 1)[-1]}
+        result = client.applications.batch_get(["a", "b", "c"])
+        assert [app["id"] for app in result] == ["a", "b", "c"]
+        assert mock_req.call_count == 3
+
     def test_update_application(self, mock_req, client):
         mock_req.return_value = {"id": "abc-123", "name": "Updated"}
         result = client.applications.update_application("abc-123", {"name": "Updated"})
         mock_req.assert_called_once_with("PUT", "/governance/application/abc-123", json={"name": "Updated"})
 
-    @patch("gia.client.IGAClient._request")
-    def test_delete_application(self, mock_req, client):
+    @pytest.mark.parametrize(
+        "method, args, exp_path",
+        [
+            ("get_object_type", ("abc-123", "__ACCOUNT__"), "/governance/application/abc-123/objectType/__ACCOUNT__"),
+            ("get_object_type_schema", ("abc-123", "__GROUP__"), "/governance/application/abc-123/__GROUP__/schema"),
+            ("get_upload_status", ("abc-123", "upload-1"), "/governance/application/abc-123/upload/:upload-1"),
+            ("get_upload_failures", ("abc-123", "upload-1"), "/governance/application/abc-123/upload/:upload-1/failures"),
+            ("get_account", ("abc-123", "acct-1"), "/governance/application/abc-123/account/acct-1"),
+            ("get_resource", ("abc-123", "res-1"), "/governance/application/abc-123/resource/res-1"),
+        ],
+    )
+    def test_simple_get(self, mock_req, client, method, args, exp_path):
+        mock_req.return_value = {}
+        getattr(client.applications, method)(*args)
+        mock_req.assert_called_once_with("GET", exp_path, params=None)
+
+    @pytest.mark.parametrize(
+        "method, args, exp_path",
+        [
+            ("delete_application", ("abc-123",), "/governance/application/abc-123"),
+            ("delete_object_type", ("abc-123", "__ACCOUNT__"), "/governance/application/abc-123/objectType/__ACCOUNT__"),
+        ],
+    )
+    def test_simple_delete(self, mock_req, client, method, args, exp_path):
         mock_req.return_value = {}
-        client.applications.delete_application("abc-123")
-        mock_req.assert_called_once_with("DELETE", "/governance/application/abc-123")
+        getattr(client.applications, method)(*args)
+        mock_req.assert_called_once_with("DELETE", exp_path)
 
-    @patch("gia.client.IGAClient._request")
     def test_add_object_type(self, mock_req, client):
         payload = {"id": "__ACCOUNT__", "type": "account", "properties": {}}
         mock_req.return_value = payload
@@ -97,13 +201,6 @@ class TestApplicationsAPI:
             "POST", "/governance/application/abc-123/objectType", json=payload, params=None,
         )
 
-    @patch("gia.client.IGAClient._request")
-    def test_get_object_type(self, mock_req, client):
-        mock_req.return_value = {"id": "__ACCOUNT__"}
-        client.applications.get_object_type("abc-123", "__ACCOUNT__")
-        mock_req.assert_called_once_with("GET", "/governance/application/abc-123/objectType/__ACCOUNT__", params=None)
-
-    @patch("gia.client.IGAClient._request")
     def test_update_object_type(self, mock_req, client):
         payload = {"id": "__ACCOUNT__", "type": "account", "properties": {"name": {}}}
         mock_req.return_value = payload
@@ -112,55 +209,127 @@ class TestApplicationsAPI:
             "PUT", "/governance/application/abc-123/objectType/__ACCOUNT__", json=payload,
         )
 
-    @patch("gia.client.IGAClient._request")
-    def test_delete_object_type(self, mock_req, client):
-        mock_req.return_value = {"message": "Object type deleted successfully"}
-        client.applications.delete_object_type("abc-123", "__ACCOUNT__")
-        mock_req.assert_called_once_with("DELETE", "/governance/application/abc-123/objectType/__ACCOUNT__")
-
-    @patch("gia.client.IGAClient._request")
-    def test_get_object_type_schema(self, mock_req, client):
-        mock_req.return_value = {"$schema": "http://json-schema.org/draft-03/schema"}
-        client.applications.get_object_type_schema("abc-123", "__GROUP__")
-        mock_req.assert_called_once_with("GET", "/governance/application/abc-123/__GROUP__/schema", params=None)
-
-    @patch("gia.client.IGAClient._request")
-    def test_get_upload_status(self, mock_req, client):
-        mock_req.return_value = {"id": "upload-1", "status": "COMPLETED"}
-        client.applications.get_upload_status("abc-123", "upload-1")
-        mock_req.assert_called_once_with("GET", "/governance/application/abc-123/upload/:upload-1", params=None)
-
-    @patch("gia.client.IGAClient._request")
-    def test_get_upload_failures(self, mock_req, client):
-        mock_req.return_value = {"result": [], "totalCount": 0}
-        client.applications.get_upload_failures("abc-123", "upload-1")
-        mock_req.assert_called_once_with("GET", "/governance/application/abc-123/upload/:upload-1/failures", params=None)
+    def test_iter_upload_failures(self, mock_req, client):
+        mock_req.return_value = {"result": [{"rowNumber": 1}], "totalCount": 1}
+        result = list(client.applications.iter_upload_failures("abc-123", "upload-1"))
+        assert result == [{"rowNumber": 1}]
+        mock_req.assert_called_once_with(
+            "GET", "/governance/application/abc-123/upload/:upload-1/failures",
+            params={"_pageSize": client.page_size, "_pagedResultsOffset": 0},
+        )
+
+    def test_upload_file_streams_multipart(self, mock_req, client, csv_file):
+        pytest.importorskip("requests_toolbelt")
+        mock_req.return_value = {"id": "upload-1"}
+        client.applications.upload_file("abc-123", str(csv_file), "__ACCOUNT__")
+        _, kwargs = mock_req.call_args
+        assert kwargs["params"] == {"_action": "upload"}
+        assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data")
+        assert "files" not in kwargs
+
+    def test_upload_file_reports_progress(self, mock_req, client, csv_file):
+        pytest.importorskip("requests_toolbelt")
+        seen = []
+
+        def send(method, path, data=None, **kwargs):
+            while data.read(8192):
+                pass
+            return {"id": "upload-1", "length": data.len}
+
+        mock_req.side_effect = send
+        resp = client.applications.upload_file(
+            "abc-123", str(csv_file), "__ACCOUNT__", progress=lambda sent, total: seen.append((sent, total))
+        )
+        assert seen
+        assert seen[-1] == (resp["length"], resp["length"])
+
+    def test_upload_file_multipart_survives_retry(self, mock_auth, csv_file):
+        pytest.importorskip("requests_toolbelt")
+        bodies = []
+
+        class Handler(BaseHTTPRequestHandler):
+            timeout = 2
+
+            def do_POST(self):
+                bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+                status, payload = (503, b"{}") if len(bodies) == 1 else (200, b'{"id": "upload-1"}')
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            c = IGAClient(f"http://127.0.0.1:{server.server_port}", "cid", "csec", "https://x/token")
+            resp = c.applications.upload_file("abc-123", str(csv_file), "__ACCOUNT__")
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert resp == {"id": "upload-1"}
+        assert len(bodies) == 2
+        assert bodies[1] == bodies[0]
+        assert b"alice" in bodies[1]
+
+    def test_upload_file_raw_body(self, mock_req, client, csv_file):
+        mock_req.return_value = {"id": "upload-1"}
+        client.applications.upload_file("abc-123", str(csv_file), "__ACCOUNT__", use_multipart=False)
+        _, kwargs = mock_req.call_args
+        assert kwargs["params"] == {"_action": "upload", "objectType": "__ACCOUNT__"}
+        assert kwargs["headers"] == {"Content-Type": "text/csv"}
+        assert "files" not in kwargs
+
+    @patch("gia.applications.MultipartEncoder", None)
+    def test_upload_file_without_toolbelt(self, mock_req, client, csv_file):
+        mock_req.return_value = {"id": "upload-1"}
+        client.applications.upload_file("abc-123", str(csv_file), "__ACCOUNT__")
+        _, kwargs = mock_req.call_args
+        assert kwargs["data"] == {"objectType": "__ACCOUNT__"}
+        assert "file" in kwargs["files"]
 
-    @patch("gia.client.IGAClient._request")
     def test_list_accounts(self, mock_req, client):
         mock_req.return_value = {"result": [{"id": "acct-1"}], "totalCount": 1}
         result = client.applications.list_accounts("abc-123")
         assert result == [{"id": "acct-1"}]
 
-    @patch("gia.client.IGAClient._request")
-    def test_get_account(self, mock_req, client):
-        mock_req.return_value = {"id": "acct-1"}
-        client.applications.get_account("abc-123", "acct-1")
-        mock_req.assert_called_once_with("GET", "/governance/application/abc-123/account/acct-1", params=None)
+    def test_list_accounts_page_size(self, mock_req, client):
+        mock_req.return_value = {"result": [{"id": "acct-1"}], "totalCount": 1}
+        client.applications.list_accounts("abc-123", page_size=500)
+        mock_req.assert_called_once_with(
+            "GET", "/governance/application/abc-123/account",
+            params={"_pageSize": 500, "_pagedResultsOffset": 0},
+        )
+
+    def test_list_resources_fields(self, mock_req, client):
+        mock_req.return_value = {"result": [{"id": "res-1"}], "totalCount": 1}
+        client.applications.list_resources("abc-123", fields="id")
+        mock_req.assert_called_once_with(
+            "GET", "/governance/application/abc-123/resource",
+            params={"_fields": "id", "_pageSize": client.page_size, "_pagedResultsOffset": 0},
+        )
+
+    def test_list_accounts_df(self, mock_req, client):
+        pytest.importorskip("pandas")
+        mock_req.return_value = {
+            "result": [
+                {"id": "acct-1", "attributes": {"mail": "a@example.com"}},
+                {"id": "acct-2", "attributes": {"mail": "b@example.com"}},
+            ],
+            "totalCount": 2,
+        }
+        df = client.applications.list_accounts_df("abc-123")
+        assert list(df["id"]) == ["acct-1", "acct-2"]
+        assert list(df["attributes.mail"]) == ["a@example.com", "b@example.com"]
 
-    @patch("gia.client.IGAClient._request")
     def test_list_resources(self, mock_req, client):
         mock_req.return_value = {"result": [{"id": "res-1"}], "totalCount": 1}
         result = client.applications.list_resources("abc-123")
         assert result == [{"id": "res-1"}]
 
-    @patch("gia.client.IGAClient._request")
-    def test_get_resource(self, mock_req, client):
-        mock_req.return_value = {"id": "res-1"}
-        client.applications.get_resource("abc-123", "res-1")
-        mock_req.assert_called_once_with("GET", "/governance/application/abc-123/resource/res-1", params=None)
-
-    @patch("gia.client.IGAClient._request")
     def test_find_application_by_name_found(self, mock_req, client):
         mock_req.return_value = {
             "result": [{"id": "abc-123", "name": "MyApp"}],
@@ -168,17 +337,65 @@ class TestApplicationsAPI:
         }
         result = client.applications.find_application_by_name("MyApp")
         assert result["id"] == "abc-123"
+        assert mock_req.call_args[1]["params"]["_fields"] == "id,name"
+        assert mock_req.call_args[1]["params"]["_pageSize"] == 1
 
-    @patch("gia.client.IGAClient._request")
     def test_find_application_by_name_not_found(self, mock_req, client):
         mock_req.return_value = {"result": [], "totalCount": 0}
         result = client.applications.find_application_by_name("NonExistent")
         assert result is None
 
+    def test_find_application_by_name_stops_after_first_page(self, mock_req, client):
+        mock_req.return_value = {"result": [{"id": "abc-123", "name": "MyApp"}], "totalCount": 3}
+        result = client.applications.find_application_by_name("MyApp")
+        assert result["id"] == "abc-123"
+        assert mock_req.call_count == 1
+
+    def test_find_application_by_name_escapes_quotes(self, mock_req, client):
+        mock_req.return_value = {"result": [], "totalCount": 0}
+        client.applications.find_application_by_name('My "Quoted" App\\')
+        query_filter = mock_req.call_args[1]["params"]["_queryFilter"]
+        assert query_filter == 'name eq "My \\"Quoted\\" App\\\\"'
+
+    def test_find_application_by_name_cached(self, mock_req, client):
+        mock_req.return_value = {"result": [{"id": "abc-123", "name": "MyApp"}], "totalCount": 1}
+        client.applications.find_application_by_name("MyApp")
+        client.applications.find_application_by_name("MyApp")
+        assert mock_req.call_count == 1
+
+    def test_find_application_by_name_invalidated_on_create(self, mock_req, client):
+        mock_req.return_value = {"result": [], "totalCount": 0}
+        assert client.applications.find_application_by_name("MyApp") is None
+        mock_req.return_value = {"id": "abc-123", "name": "MyApp"}
+        client.applications.create_application({"name": "MyApp"})
+        mock_req.return_value = {"result": [{"id": "abc-123", "name": "MyApp"}], "totalCount": 1}
+        assert client.applications.find_application_by_name("MyApp")["id"] == "abc-123"
+        assert mock_req.call_count == 3
+
+    def test_find_application_by_name_returns_copy(self, mock_req, client):
+        mock_req.return_value = {"result": [{"id": "abc-123", "name": "MyApp"}], "totalCount": 1}
+        client.applications.find_application_by_name("MyApp")["name"] = "Mutated"
+        assert client.applications.find_application_by_name("MyApp")["name"] == "MyApp"
+
+    def test_find_application_by_name_invalidated_after_write(self, mock_req, client):
+        def request(method, path, params=None, json=None):
+            if method == "POST":
+                # A lookup racing the create caches the pre-create miss
+                assert client.applications.find_application_by_name("MyApp") is None
+                return {"id": "abc-123", "name": "MyApp"}
+            if created:
+                return {"result": [{"id": "abc-123", "name": "MyApp"}], "totalCount": 1}
+            return {"result": [], "totalCount": 0}
+
+        created = False
+        mock_req.side_effect = request
+        client.applications.create_application({"name": "MyApp"})
+        created = True
+        assert client.applications.find_application_by_name("MyApp")["id"] == "abc-123"
+
 
 class TestPagination:
 
-    @patch("gia.client.IGAClient._request")
     def test_auto_paginates(self, mock_req, client):
         mock_req.side_effect = [
             {"result": [{"id": "1"}, {"id": "2"}], "totalCount": 3, "resultCount": 2},
@@ -188,13 +405,97 @@ class TestPagination:
         assert len(results) == 3
         assert mock_req.call_count == 2
 
-    @patch("gia.client.IGAClient._request")
     def test_respects_max_pages(self, mock_req, client):
         mock_req.return_value = {"result": [{"id": "1"}], "totalCount": 100, "resultCount": 1}
         results = client.api_get_paginated("/governance/application", page_size=1, max_pages=2)
         assert mock_req.call_count == 2
 
-    @patch("gia.client.IGAClient._request")
+    def test_iter_paginated_fetches_lazily(self, mock_req, client):
+        mock_req.return_value = {"result": [{"id": "1"}], "totalCount": 100, "resultCount": 1}
+        pages = client.iter_paginated("/governance/application", page_size=1)
+        assert next(pages) == {"id": "1"}
+        assert mock_req.call_count == 1
+
+    def test_parallel_pages_keep_offset_order(self, mock_req, client):
+        def page(method, path, params=None):
+            # Later pages answer first, so ordering must come from the offsets
+            offset = params["_pagedResultsOffset"]
+            time.sleep(0.01 * (10 - offset))
+            return {"result": [{"id": str(offset)}, {"id": str(offset + 1)}], "totalCount": 10}
+
+        mock_req.side_effect = page
+        results = client.api_get_paginated("/governance/application", page_size=2)
+        assert [r["id"] for r in results] == [str(i) for i in range(10)]
+        assert mock_req.call_count == 5
+
+    def test_bounds_pages_fetched_ahead_of_consumer(self, mock_req, client):
+        mock_req.side_effect = lambda method, path, params=None: {
+            "result": [{"id": str(params["_pagedResultsOffset"] + i)} for i in range(2)],
+            "totalCount": 2000,
+        }
+        pages = client.iter_paginated("/governance/application", page_size=2)
+        assert [next(pages)["id"] for _ in range(3)] == ["0", "1", "2"]
+        time.sleep(0.2)
+        # First page, plus a window of 2 * max_workers, plus one refill
+        assert mock_req.call_count == 2 + 2 * client.max_workers
+        pages.close()
+        assert mock_req.call_count <= 2 + 2 * client.max_workers
+
+    def test_bounded_window_yields_every_page(self, mock_req, client):
+        mock_req.side_effect = lambda method, path, params=None: {
+            "result": [{"id": params["_pagedResultsOffset"]}],
+            "totalCount": 100,
+        }
+        results = client.api_get_paginated("/governance/application", page_size=1)
+        assert [r["id"] for r in results] == list(range(100))
+
+    def test_steps_by_server_clamped_page_size(self, mock_req, client):
+        mock_req.side_effect = lambda method, path, params=None: {
+            "result": [{"id": str(params["_pagedResultsOffset"])}],
+            "totalCount": 3,
+        }
+        results = client.api_get_paginated("/governance/application", page_size=50)
+        assert [r["id"] for r in results] == ["0", "1", "2"]
+
+    def test_steps_down_page_size_on_400(self, mock_req, client):
+        def page(method, path, params=None):
+            if params["_pageSize"] > 100:
+                raise IGAClientError("page size too large", status_code=400)
+            return {"result": [{"id": "1"}], "totalCount": 1}
+
+        mock_req.side_effect = page
+        results = client.api_get_paginated("/governance/application")
+        assert len(results) == 1
+        assert client.page_size == 100
+
+    def test_other_400_does_not_step_down(self, mock_req, client):
+        default = client.page_size
+        mock_req.side_effect = IGAClientError("Invalid _queryFilter", status_code=400)
+        with pytest.raises(IGAClientError):
+            client.api_get_paginated("/governance/application", params={"_queryFilter": "bad"})
+        assert mock_req.call_count == 1
+        assert client.page_size == default
+
+    def test_failed_step_down_keeps_default(self, mock_req, client):
+        default = client.page_size
+        mock_req.side_effect = IGAClientError("page size too large", status_code=400)
+        with pytest.raises(IGAClientError):
+            client.api_get_paginated("/governance/application")
+        assert client.page_size == default
+
+    @pytest.mark.parametrize("value", ["abc", "0", "-5"])
+    def test_invalid_page_size_env_uses_default(self, monkeypatch, value):
+        monkeypatch.setenv("GIA_PAGE_SIZE", value)
+        with patch("gia.client.OAuth2ClientCredentials"):
+            c = IGAClient("https://example.com", "a", "b", "https://x/token")
+        assert c.page_size == 200
+
+    def test_page_size_from_env(self, monkeypatch):
+        monkeypatch.setenv("GIA_PAGE_SIZE", "500")
+        with patch("gia.client.OAuth2ClientCredentials"):
+            c = IGAClient("https://example.com", "a", "b", "https://x/token")
+        assert c.page_size == 500
+
     def test_single_page(self, mock_req, client):
         mock_req.return_value = {"result": [{"id": "1"}], "totalCount": 1, "resultCount": 1}
         results = client.api_get_paginated("/governance/application")
@@ -202,25 +503,37 @@ class TestPagination:
         assert mock_req.call_count == 1
 
 
+class FakeResponse:
+    """Minimal stand-in for ``requests.Response``."""
+
+    def __init__(self, status_code: int = 200, content: bytes = b""):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
 class TestResponseHandling:
 
     def test_404_raises_not_found(self, client):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 404
         with pytest.raises(IGANotFoundError):
-            client._handle_response(mock_resp)
+            client._handle_response(FakeResponse(404))
 
     def test_500_raises_client_error(self, client):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 500
-        mock_resp.json.return_value = {"message": "Internal error"}
+        resp = FakeResponse(500, b'{"message": "Internal error"}')
         with pytest.raises(IGAClientError) as exc_info:
-            client._handle_response(mock_resp)
+            client._handle_response(resp)
         assert exc_info.value.status_code == 500
+        assert exc_info.value.message == "Internal error"
 
     def test_204_returns_empty_dict(self, client):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 204
-        mock_resp.content = b""
-        result = client._handle_response(mock_resp)
-        assert result == {}
\ No newline at end of file
+        result = client._handle_response(FakeResponse(204))
+        assert result == {}
+
+    def test_200_decodes_body(self, client):
+        resp = FakeResponse(200, b'{"result": [{"id": "1"}], "totalCount": 1}')
+        resp.json = lambda: pytest.fail("success bodies should be decoded from resp.content")
+        result = client._handle_response(resp)
+        assert result == {"result": [{"id": "1"}], "totalCount": 1}
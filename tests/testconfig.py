@@ -0,0 +1,105 @@
+"""Tests for CLI profile storage."""
+
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from gia_cli.config import ConfigManager, _read_config_cached
+
+PROFILE = {
+    "base_url": "https://tenant.example.com",
+    "client_id": "cid",
+    "client_secret": "csec",
+    "token_endpoint": "https://tenant.example.com/am/oauth2/access_token",
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ConfigManager(tmp_path)
+
+
+class TestConfigManager:
+
+    def test_round_trip(self, manager):
+        manager.set_profile("default", **PROFILE)
+        assert manager.get_profile("default") == PROFILE
+        assert json.loads(manager.config_path.read_text()) == {"profiles": {"default": PROFILE}}
+
+    def test_file_is_user_only(self, manager):
+        manager.set_profile("default", **PROFILE)
+        assert stat.S_IMODE(manager.config_path.stat().st_mode) == 0o600
+
+    def test_concurrent_writers(self, tmp_path):
+        def write(i):
+            ConfigManager(tmp_path).save_config({"profiles": {f"p{i}": PROFILE}})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(32)))
+        assert len(json.loads((tmp_path / "config.json").read_text())["profiles"]) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+    def test_migrates_legacy_yaml(self, manager):
+        manager.legacy_config_path.write_text(
+            "profiles:\n"
+            "  default:\n"
+            + "".join(f"    {k}: {v}\n" for k, v in PROFILE.items())
+            + "    rotated: 2024-01-31\n"
+        )
+        profile = manager.get_profile("default")
+        assert profile == {**PROFILE, "rotated": "2024-01-31"}
+        assert not manager.legacy_config_path.exists()
+        assert json.loads(manager.config_path.read_text())["profiles"]["default"] == profile
+
+    def test_picks_up_external_edit(self, manager):
+        manager.set_profile("default", **PROFILE)
+        manager.get_profile("default")
+        edited = {**PROFILE, "client_id": "edited-client-id"}
+        manager.config_path.write_text(json.dumps({"profiles": {"default": edited}}))
+        st = manager.config_path.stat()
+        os.utime(manager.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert manager.get_profile("default")["client_id"] == "edited-client-id"
+
+    @pytest.mark.parametrize("content", ["", "  \n", "null"])
+    def test_empty_or_null_file(self, manager, content):
+        manager.config_dir.mkdir(exist_ok=True)
+        manager.config_path.write_text(content)
+        assert manager.load_config() == {}
+        assert manager.list_profiles() == []
+        with pytest.raises(ValueError, match="not found"):
+            manager.get_profile("default")
+
+    def test_non_mapping_file_raises_value_error(self, manager):
+        manager.config_path.write_text("[]")
+        with pytest.raises(ValueError, match="mapping"):
+            manager.get_profile("default")
+
+    def test_incomplete_profile(self, manager):
+        manager.config_path.write_text(json.dumps({"profiles": {"default": {"base_url": "x"}}}))
+        with pytest.raises(ValueError, match="missing required fields"):
+            manager.get_profile("default")
+
+    def test_set_profiles_rejects_whole_batch(self, manager):
+        manager.set_profile("default", **PROFILE)
+        before = manager.config_path.read_bytes()
+        with pytest.raises(ValueError, match="'broken' is missing required fields"):
+            manager.set_profiles({"ok": PROFILE, "broken": {"base_url": "x"}})
+        assert manager.config_path.read_bytes() == before
+        assert manager.list_profiles() == ["default"]
+
+    def test_set_profile_delegates_to_set_profiles(self, manager):
+        with patch.object(manager, "set_profiles") as set_profiles:
+            manager.set_profile("default", **PROFILE, scopes="fr:idm:*")
+        set_profiles.assert_called_once_with({"default": {**PROFILE, "scopes": "fr:idm:*"}})
+
+    def test_second_manager_reuses_parse(self, manager):
+        manager.config_path.write_text(json.dumps({"profiles": {"default": PROFILE}}))
+        _read_config_cached.cache_clear()
+        assert manager.get_profile("default") == PROFILE
+        assert ConfigManager(manager.config_dir).get_profile("default") == PROFILE
+        info = _read_config_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
@@ -9,7 +9,6 @@ from gia import (
     DisconnectedApplication,
     IGAClient,
     IGAClientError,
-    IGANotFoundError,
 )
 
 
@@ -49,6 +48,23 @@ class TestDisconnectedApplicationBuilder:
         with pytest.raises(ValueError, match="not defined"):
             app.add_file_upload("accounts.csv", "__ACCOUNT__")
 
+    def test_from_config(self):
+        app = DisconnectedApplication.from_config({
+            "name": "MyApp",
+            "description": "desc",
+            "owner_ids": ["user-1"],
+            "object_types": {
+                "__ACCOUNT__": {"type": "account", "properties": {"id": {"type": "string"}}},
+                "Roles": {"type": "resource"},
+            },
+        })
+        assert app.name == "MyApp"
+        assert app.owner_ids == ["user-1"]
+        assert app.icon == ""
+        assert app.object_types["__ACCOUNT__"].properties == {"id": {"type": "string"}}
+        assert app.object_types["Roles"].properties == {}
+        assert list(app.to_application_payload()["objectTypes"]) == ["__ACCOUNT__", "Roles"]
+
     def test_to_application_payload(self):
         app = DisconnectedApplication(
             name="MyApp",
@@ -92,7 +108,7 @@ class TestPushOrchestration:
         apps = mock_client.applications
         apps.find_application_by_name.return_value = None
         apps.create_application.return_value = {"id": "new-id", "name": "TestApp"}
-        apps.get_object_type.side_effect = IGANotFoundError("not found")
+        apps.get_application.return_value = {}
         apps.add_object_type.return_value = {}
 
         app = DisconnectedApplication(name="TestApp")
@@ -104,7 +120,8 @@ class TestPushOrchestration:
         apps.add_object_type.assert_called_once()
         assert result.application_id == "new-id"
 
-    def test_push_upsert_true_warns_and_updates(self, mock_client):
+    def test_push_upsert_true_warns_and_updates(self, mock_client, monkeypatch):
+        monkeypatch.setattr(DisconnectedApplication, "_upsert_warned", False)
         apps = mock_client.applications
         apps.find_application_by_name.return_value = {"id": "existing-id", "name": "TestApp"}
         apps.update_application.return_value = {"id": "existing-id", "name": "TestApp"}
@@ -121,6 +138,23 @@ class TestPushOrchestration:
         apps.create_application.assert_not_called()
         assert result.application_id == "existing-id"
 
+    def test_push_upsert_warns_once_then_logs(self, mock_client, monkeypatch, caplog):
+        monkeypatch.setattr(DisconnectedApplication, "_upsert_warned", False)
+        apps = mock_client.applications
+        apps.find_application_by_name.return_value = {"id": "existing-id", "name": "TestApp"}
+        apps.update_application.return_value = {"id": "existing-id", "name": "TestApp"}
+
+        app = DisconnectedApplication(name="TestApp")
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            with caplog.at_level("WARNING", logger="gia.templates"):
+                app.push(mock_client)
+                app.push(mock_client)
+            assert len(w) == 1
+
+        assert sum("already exists" in r.getMessage() for r in caplog.records) == 2
+
     def test_push_upsert_false_raises_on_existing(self, mock_client):
         apps = mock_client.applications
         apps.find_application_by_name.return_value = {"id": "existing-id", "name": "TestApp"}
@@ -134,7 +168,7 @@ class TestPushOrchestration:
         apps = mock_client.applications
         apps.find_application_by_name.return_value = None
         apps.create_application.return_value = {"id": "new-id"}
-        apps.get_object_type.return_value = {"id": "__ACCOUNT__"}  # exists
+        apps.get_application.return_value = {"objectTypes": {"__ACCOUNT__": {}}}  # exists
         apps.update_object_type.return_value = {}
 
         app = DisconnectedApplication(name="TestApp")
@@ -144,12 +178,14 @@ class TestPushOrchestration:
 
         apps.update_object_type.assert_called_once()
         apps.add_object_type.assert_not_called()
+        apps.get_application.assert_called_once_with("new-id", fields="objectTypes")
+        apps.get_object_type.assert_not_called()
 
     def test_push_creates_new_object_types(self, mock_client):
         apps = mock_client.applications
         apps.find_application_by_name.return_value = None
         apps.create_application.return_value = {"id": "new-id"}
-        apps.get_object_type.side_effect = IGANotFoundError("not found")
+        apps.get_application.return_value = {}
         apps.add_object_type.return_value = {}
 
         app = DisconnectedApplication(name="TestApp")
@@ -159,17 +195,67 @@ class TestPushOrchestration:
 
         apps.add_object_type.assert_called_once()
 
-    def test_push_uploads_files(self, mock_client, tmp_path):
+    def test_push_bulk_uses_embedded_object_types(self, mock_client):
+        apps = mock_client.applications
+        apps.find_application_by_name.return_value = None
+        apps.create_application.return_value = {
+            "id": "new-id",
+            "objectTypes": {"__ACCOUNT__": {"id": "__ACCOUNT__"}},
+        }
+
+        app = DisconnectedApplication(name="TestApp")
+        app.add_object_type("__ACCOUNT__", "account")
+
+        result = app.push(mock_client)
+
+        assert "objectTypes" in apps.create_application.call_args[0][0]
+        assert result.object_type_responses == {"__ACCOUNT__": {"id": "__ACCOUNT__"}}
+        apps.get_application.assert_not_called()
+        apps.add_object_type.assert_not_called()
+        apps.update_object_type.assert_not_called()
+
+    def test_push_bulk_disabled_pushes_each_object_type(self, mock_client):
+        apps = mock_client.applications
+        apps.find_application_by_name.return_value = None
+        apps.create_application.return_value = {
+            "id": "new-id",
+            "objectTypes": {"__ACCOUNT__": {"id": "__ACCOUNT__"}},
+        }
+        apps.get_application.return_value = {"objectTypes": {"__ACCOUNT__": {}}}
+        apps.update_object_type.return_value = {}
+
+        app = DisconnectedApplication(name="TestApp")
+        app.add_object_type("__ACCOUNT__", "account")
+
+        app.push(mock_client, push_bulk_object_types=False)
+
+        apps.update_object_type.assert_called_once()
+
+    def test_push_many_object_types_keeps_responses_keyed(self, mock_client):
+        apps = mock_client.applications
+        apps.find_application_by_name.return_value = None
+        apps.create_application.return_value = {"id": "new-id"}
+        apps.get_application.return_value = {}
+        apps.add_object_type.side_effect = lambda app_id, body: {"id": body["id"]}
+
+        app = DisconnectedApplication(name="TestApp")
+        for ot_id in ("__ACCOUNT__", "__GROUP__", "Roles", "Entitlements"):
+            app.add_object_type(ot_id, "resource")
+
+        result = app.push(mock_client, upsert=False)
+
+        assert list(result.object_type_responses) == ["__ACCOUNT__", "__GROUP__", "Roles", "Entitlements"]
+        assert all(resp["id"] == ot_id for ot_id, resp in result.object_type_responses.items())
+        assert apps.add_object_type.call_count == 4
+
+    def test_push_uploads_files(self, mock_client, csv_file):
         apps = mock_client.applications
         apps.find_application_by_name.return_value = None
         apps.create_application.return_value = {"id": "new-id"}
-        apps.get_object_type.side_effect = IGANotFoundError("not found")
+        apps.get_application.return_value = {}
         apps.add_object_type.return_value = {}
         apps.upload_file.return_value = {"message": "Upload started"}
 
-        csv_file = tmp_path / "accounts.csv"
-        csv_file.write_text("id,user_name\n1,alice\n")
-
         app = DisconnectedApplication(name="TestApp")
         app.add_object_type("__ACCOUNT__", "account")
         app.add_file_upload(str(csv_file), "__ACCOUNT__")
@@ -179,11 +265,33 @@ class TestPushOrchestration:
         apps.upload_file.assert_called_once_with("new-id", str(csv_file), "__ACCOUNT__")
         assert len(result.upload_responses) == 1
 
+    def test_push_parallel_uploads_preserve_order(self, mock_client, tmp_path):
+        apps = mock_client.applications
+        apps.find_application_by_name.return_value = None
+        apps.create_application.return_value = {"id": "new-id"}
+        apps.get_application.return_value = {}
+        apps.add_object_type.return_value = {}
+        apps.upload_file.side_effect = lambda app_id, path, ot: {"file": path}
+
+        app = DisconnectedApplication(name="TestApp")
+        app.add_object_type("__ACCOUNT__", "account")
+        paths = []
+        for i in range(6):
+            csv_file = tmp_path / f"accounts{i}.csv"
+            csv_file.write_text("id,user_name\n1,alice\n")
+            app.add_file_upload(str(csv_file), "__ACCOUNT__")
+            paths.append(str(csv_file))
+
+        result = app.push(mock_client, parallel_uploads=3)
+
+        assert [r["file"] for r in result.upload_responses] == paths
+        assert apps.upload_file.call_count == 6
+
     def test_push_result_fields(self, mock_client):
         apps = mock_client.applications
         apps.find_application_by_name.return_value = None
         apps.create_application.return_value = {"id": "new-id", "name": "TestApp"}
-        apps.get_object_type.side_effect = IGANotFoundError("not found")
+        apps.get_application.return_value = {}
         apps.add_object_type.return_value = {"id": "__ACCOUNT__"}
 
         app = DisconnectedApplication(name="TestApp")